@@ -1,6 +1,441 @@
 # game_logic.py
 # This file contains the core logic for the checkers game, including AI.
 
+from __future__ import annotations
+
+import math
+import random
+import time
+from collections import namedtuple
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any
+
+njit: Callable[..., Any] | None
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; without it the board kernels run as plain Python
+    njit = None
+
+# Board positions are (row, col) tuples, moves are (start_pos, end_pos) pairs of them
+Position = tuple[int, int]
+Move = tuple[Position, Position]
+
+# Square (r, c) of the board is stored as bit r * 8 + c of each bitboard.
+# Only dark squares are ever occupied, so every bitboard fits in a signed 64-bit integer.
+DARK_SQUARES = sum(1 << (r * 8 + c) for r in range(8) for c in range(8) if (r + c) % 2 == 1)
+RANK_MASK = tuple(DARK_SQUARES & (0xFF << (r * 8)) for r in range(8))  # Dark squares of row r
+# Bit k of the row number, for all dark squares at once: sum(2**k * popcount(x & ROW_BIT_MASK[k]))
+# is the sum of the row numbers of the pieces in x
+ROW_BIT_MASK = tuple(sum(RANK_MASK[r] for r in range(8) if r >> k & 1) for k in range(3))
+
+
+def _build_step_squares(dr, dc):
+    """Returns a per-square tuple with the neighbouring square in direction (dr, dc), or -1 off-board."""
+    squares = []
+    for sq in range(64):
+        r, c = divmod(sq, 8)
+        nr, nc = r + dr, c + dc
+        squares.append(nr * 8 + nc if 0 <= nr < 8 and 0 <= nc < 8 else -1)
+    return tuple(squares)
+
+
+def _build_king_rays():
+    """
+    Returns per-square tuples of the 4 diagonal rays (NW, NE, SW, SE) leading away from the square.
+    Each ray is padded to 7 squares with RAY_END.
+    """
+    rays = []
+    for sq in range(64):
+        r, c = divmod(sq, 8)
+        square_rays = []
+        for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+            ray = [(r + dr * i) * 8 + c + dc * i for i in range(1, 8) if 0 <= r + dr * i < 8 and 0 <= c + dc * i < 8]
+            square_rays.append(tuple(ray + [RAY_END] * (7 - len(ray))))
+        rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+def _build_between_masks():
+    """Returns a flat 64*64 tuple with the squares strictly between two squares on a common diagonal."""
+    masks = [0] * (64 * 64)
+    for sq in range(64):
+        r, c = divmod(sq, 8)
+        for dr in [-1, 1]:
+            for dc in [-1, 1]:
+                path = 0
+                for i in range(1, 8):
+                    nr, nc = r + dr * i, c + dc * i
+                    if not (0 <= nr < 8 and 0 <= nc < 8):
+                        break
+                    masks[sq * 64 + nr * 8 + nc] = path
+                    path |= 1 << (nr * 8 + nc)
+    return tuple(masks)
+
+
+def _build_pawn_captures(forward_squares):
+    """
+    Returns per-square pairs of (middle, landing) squares for a pawn's two forward jumps.
+    Jumps that leave the board point at RAY_END for both squares.
+    """
+    captures = []
+    for sq in range(64):
+        jumps = []
+        for step in forward_squares:
+            middle = step[sq]
+            landing = step[middle] if middle >= 0 else -1
+            jumps.append((middle, landing) if landing >= 0 else (RAY_END, RAY_END))
+        captures.append(tuple(jumps))
+    return tuple(captures)
+
+
+# Single diagonal steps: north is towards row 0 (white's forward direction), south towards row 7
+NW_SQUARE = _build_step_squares(-1, -1)
+NE_SQUARE = _build_step_squares(-1, 1)
+SW_SQUARE = _build_step_squares(1, -1)
+SE_SQUARE = _build_step_squares(1, 1)
+WHITE_FORWARD_SQUARES = (NW_SQUARE, NE_SQUARE)  # Pawn directions per player
+BLACK_FORWARD_SQUARES = (SW_SQUARE, SE_SQUARE)
+BETWEEN_MASK = _build_between_masks()
+
+# Diagonal rays are padded with the light corner square (0, 0), which no ray from a dark square ever crosses.
+# The kernels treat it as occupied, so walking a ray stops at the board edge without a bounds check.
+RAY_END = 0
+RAY_END_BIT = 1 << RAY_END
+KING_RAYS = _build_king_rays()
+
+# Columns a pawn can jump west (towards column 0) or east from, for whole-board shift move generation.
+# Like every mask the kernels use, they hold dark squares only: the light corner square 63 would make
+# the value too big for a signed 64-bit integer, and Numba would no longer compile the kernels.
+JUMP_WEST_SOURCES = DARK_SQUARES & sum(1 << (r * 8 + c) for r in range(8) for c in range(2, 8))
+JUMP_EAST_SOURCES = DARK_SQUARES & sum(1 << (r * 8 + c) for r in range(8) for c in range(6))
+
+# Squares a pawn can step to, as a bitboard indexed by pawn code (index 0 is unused), then square.
+# Built for the light squares too, where a black pawn would step onto the light square 63.
+PAWN_MOVE_MASK = tuple(
+    tuple(DARK_SQUARES & sum(1 << step[sq] for step in forward_squares if step[sq] >= 0) for sq in range(64))
+    for forward_squares in (WHITE_FORWARD_SQUARES, WHITE_FORWARD_SQUARES, BLACK_FORWARD_SQUARES)
+)
+
+# Pawn jumps indexed by pawn code (index 0 is unused), then square. A jump off the board lands on
+# RAY_END, which never holds an opponent piece, so the capture kernel needs no bounds check.
+PAWN_CAPTURES = (
+    _build_pawn_captures(WHITE_FORWARD_SQUARES),
+    _build_pawn_captures(WHITE_FORWARD_SQUARES),
+    _build_pawn_captures(BLACK_FORWARD_SQUARES),
+)
+
+# Zobrist keys: one random 64-bit number per (piece code, square), plus keys for the side to move
+# and for the square of a piece that must continue capturing. Seeded for reproducible AI behaviour.
+_zobrist_random = random.Random(2024)
+ZOBRIST = ((0,) * 64,) + tuple(tuple(_zobrist_random.getrandbits(64) for _ in range(64)) for _ in range(4))
+ZOBRIST_SIDE = _zobrist_random.getrandbits(64)  # XOR-ed in when black is to move
+ZOBRIST_FORCED = tuple(_zobrist_random.getrandbits(64) for _ in range(64))
+
+# Checkers is symmetric under turning the board by 180 degrees and swapping the colours: the twin of
+# a position, with the other side to move, has the same value. ZOBRIST_ROTATED[piece][sq] is the key
+# of the twin's piece, so a key built from it is the Zobrist key of the twin. (A left-right mirror is
+# no symmetry here, it would move the pieces onto the light squares.)
+COLOUR_SWAP = (0, 2, 1, 4, 3)
+ZOBRIST_ROTATED = tuple(tuple(ZOBRIST[COLOUR_SWAP[piece]][63 - sq] for sq in range(64)) for piece in range(5))
+
+# Initial search window bounds
+NEG_INF, POS_INF = -math.inf, math.inf
+
+# Iterative deepening: each deeper search starts with a window of this half-width around the previous
+# iteration's score, and the AI stops deepening once its time budget (in seconds) is used up.
+ASPIRATION_WINDOW = 50
+AI_TIME_BUDGET = 5.0
+
+# Piece codes of each player's pawns and kings, indexed by player_type
+PAWN_CODE = (0, 1, 2)
+KING_CODE = (0, 3, 4)
+
+# Contribution of each piece code on each square to the evaluation, from white's point of view.
+# Matches _evaluate_bitboards, so make_move_inplace can keep Bitboards.score up to date with deltas.
+PIECE_SQUARE_SCORE = (
+    (0,) * 64,
+    tuple(10 + 7 - sq // 8 for sq in range(64)),  # White pawn: 10 plus advancement towards row 0
+    tuple(-(10 + sq // 8) for sq in range(64)),  # Black pawn: 10 plus advancement towards row 7
+    (30,) * 64,  # White king
+    (-30,) * 64,  # Black king
+)
+
+# Transposition table entry flags: the stored value is exact, a lower bound or an upper bound
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+TT_MAX_ENTRIES = 1 << 18  # The table is cleared when it grows beyond this many positions
+
+# Move ordering priorities for alpha-beta: transposition table move, promotions, killer moves.
+# Captures are ordered among themselves by MVV_LVA_SCORE, remaining quiet moves by their history score.
+ORDER_TT_MOVE = 1_000_000_000
+ORDER_PROMOTION = 100_000
+ORDER_KILLER = 10_000
+PIECE_VALUE = (0, 10, 10, 30, 30)  # Material value per piece code, as in the evaluation
+MVV_LVA_SCORE = tuple(tuple(PIECE_VALUE[victim] * 100 - PIECE_VALUE[attacker] for attacker in range(5))
+                      for victim in range(5))  # Indexed [captured piece][capturing piece]
+ORDER_KEY = itemgetter(0)  # Sort key of the (score, move) pairs built by iter_ordered_moves
+MAX_PLY = 64  # Killer move slots; deeper than any search depth the AI uses
+
+# Value of a won game (the opponent has no moves) minus the number of plies to reach it, so the
+# quickest win is preferred. Scores beyond WIN_THRESHOLD are wins or losses, not evaluations.
+WIN_SCORE = 10_000
+WIN_THRESHOLD = WIN_SCORE - MAX_PLY
+
+
+# Record of a move made in place by make_move_inplace, used by unmake_move to take it back.
+# captured_piece is 0 for a move without a capture; promoted is True when a pawn became a king.
+Undo = namedtuple("Undo", ["moved_piece", "from_sq", "to_sq", "captured_piece", "captured_sq", "promoted"])
+
+
+def _compute_key(board, zobrist=ZOBRIST):
+    """Computes the Zobrist key of the pieces on the board from scratch, using the zobrist table."""
+    key = 0
+    for piece, pieces in enumerate((board.wp, board.bp, board.wk, board.bk), start=1):
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            key ^= zobrist[piece][bit.bit_length() - 1]
+    return key
+
+
+def _search_key(board: Bitboards, player_type: int, forced_capture_mask: int) -> tuple[int, bool]:
+    """
+    Returns (key, rotated): the transposition table key of a search position (the pieces, the side
+    to move and the piece that must continue capturing, as a mask) and whether it is the key of its
+    rotated twin, see ZOBRIST_ROTATED. A position and its twin share the smaller of their two keys.
+    """
+    key, rotated_key = board.key, board.rotated_key
+    # The twin has the other side to move
+    if player_type == 2:
+        key ^= ZOBRIST_SIDE
+    else:
+        rotated_key ^= ZOBRIST_SIDE
+    if forced_capture_mask:
+        sq = forced_capture_mask.bit_length() - 1
+        key ^= ZOBRIST_FORCED[sq]
+        rotated_key ^= ZOBRIST_FORCED[63 - sq]
+    if rotated_key < key:
+        return rotated_key, True
+    return key, False
+
+
+def _position_mask(position: Position | None) -> int:
+    """
+    Converts the game's forced_capture_piece to the mask the search uses instead:
+    the bit of the square, or 0 without a forced piece.
+    """
+    return 1 << (position[0] * 8 + position[1]) if position else 0
+
+
+def _rotate_move(move: Move) -> Move:
+    """Turns a (start_pos, end_pos) move by 180 degrees, between a position and its rotated twin."""
+    (start_row, start_col), (end_row, end_col) = move
+    return (7 - start_row, 7 - start_col), (7 - end_row, 7 - end_col)
+
+
+def _mask_to_positions(mask):
+    """Converts a bitboard to a list of (row, col) tuples in row-major order."""
+    positions = []
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        positions.append(divmod(bit.bit_length() - 1, 8))
+    return positions
+
+
+def _copy_moves(result):
+    """
+    Returns a copy of a (moves_dict, flag) result kept in the moves cache, so that a caller changing
+    the moves it was given cannot change the cached ones.
+    """
+    moves, flag = result
+    return {start_pos: end_positions[:] for start_pos, end_positions in moves.items()}, flag
+
+
+def _evaluate_bitboards(wp, bp, wk, bk):
+    """
+    Scores the position from white's point of view: pawns are worth 10 plus a bonus for advancing
+    (white towards row 0, black towards row 7), kings are more valuable (30).
+    Only a new board is scored like this; moves keep Bitboards.score up to date with deltas.
+    """
+    white_pawns = wp.bit_count()
+    score = 10 * (white_pawns - bp.bit_count()) + 30 * (wk.bit_count() - bk.bit_count())
+    # White's advancement is 7 - row per pawn and black's is row, evaluated for all squares at once
+    score += 7 * white_pawns
+    for k in range(3):
+        score -= (1 << k) * ((wp & ROW_BIT_MASK[k]).bit_count() + (bp & ROW_BIT_MASK[k]).bit_count())
+    return score
+
+
+# Board kernels: module-level functions on plain integers, compiled by Numba when it is installed.
+# They cover the per-node work of the AI search (move and capture generation).
+# Compiled kernels release the GIL, so the GUI thread keeps running while the AI's search thread is in them.
+
+def _jit(function):
+    """Compiles a board kernel with Numba if available, otherwise returns it unchanged."""
+    return njit(cache=True, nogil=True)(function) if njit is not None else function
+
+
+@_jit
+def _move_targets_kernel(sq, piece, occupied):
+    """Returns the bitboard of squares the piece on sq can move to without capturing."""
+    targets = 0
+    if piece == 1 or piece == 2:  # Pawns: one step along the forward diagonals, onto empty squares
+        targets = PAWN_MOVE_MASK[piece][sq] & ~occupied
+    else:  # Kings slide diagonally in 4 directions until blocked by another piece or the edge
+        blocked = occupied | RAY_END_BIT
+        for ray in KING_RAYS[sq]:
+            for target in ray:
+                if (blocked >> target) & 1:
+                    break
+                targets |= 1 << target
+    return targets
+
+
+@_jit
+def _capture_targets_kernel(sq, piece, opponent, occupied):
+    """Returns the bitboard of squares the piece on sq can land on by capturing an opponent piece."""
+    targets = 0
+    if piece == 1 or piece == 2:  # Pawns: capture by jumping 2 squares forward
+        # middle is the square of a potential opponent piece, landing the square behind it (destination)
+        for middle, landing in PAWN_CAPTURES[piece][sq]:
+            if (opponent >> middle) & 1 and not (occupied >> landing) & 1:
+                targets |= 1 << landing
+    else:  # Kings: capture at a distance in all 4 diagonal directions
+        blocked = occupied | RAY_END_BIT
+        for ray in KING_RAYS[sq]:
+            opponent_found_on_path = False
+            for target in ray:
+                if (blocked >> target) & 1:
+                    # Own piece, a second piece after the captured one, or the board edge blocks the path
+                    if opponent_found_on_path or not (opponent >> target) & 1:
+                        break
+                    opponent_found_on_path = True
+                elif opponent_found_on_path:  # Empty square behind the opponent is a valid landing spot
+                    targets |= 1 << target
+    return targets
+
+
+@_jit
+def _can_move_kernel(player_type, wp, bp, wk, bk):
+    """Returns True if any piece of player_type can move to a neighbouring square (captures aside)."""
+    if player_type == 1:
+        pawns, kings = wp, wk
+    else:
+        pawns, kings = bp, bk
+    empty = DARK_SQUARES & ~(wp | bp | wk | bk)
+
+    # Steps for all pieces at once. A step off the side of the board wraps to a light square,
+    # which masking with the empty dark squares drops, like a step off the top or bottom.
+    if player_type == 1:
+        forward = (pawns | kings) >> 9 | (pawns | kings) >> 7
+        backward = kings << 7 | kings << 9
+    else:
+        forward = (pawns | kings) << 7 | (pawns | kings) << 9
+        backward = kings >> 9 | kings >> 7
+    return ((forward | backward) & empty) != 0
+
+
+@_jit
+def _can_capture_kernel(player_type, wp, bp, wk, bk):
+    """Returns True if any piece of player_type can capture."""
+    if player_type == 1:
+        pawns, kings, opponent = wp, wk, bp | bk
+    else:
+        pawns, kings, opponent = bp, bk, wp | wk
+    occupied = pawns | kings | opponent
+    empty = DARK_SQUARES & ~occupied
+
+    # Pawn jumps for all pawns at once: shifting by 9 steps a diagonal west (north for white), by 7 east.
+    # Landing squares are masked with the empty dark squares, which also drops shifts off the board.
+    if player_type == 1:
+        if ((((pawns & JUMP_WEST_SOURCES) >> 9) & opponent) >> 9) & empty:
+            return True
+        if ((((pawns & JUMP_EAST_SOURCES) >> 7) & opponent) >> 7) & empty:
+            return True
+    else:
+        if ((((pawns & JUMP_WEST_SOURCES) << 7) & opponent) << 7) & empty:
+            return True
+        if ((((pawns & JUMP_EAST_SOURCES) << 9) & opponent) << 9) & empty:
+            return True
+
+    while kings:
+        bit = kings & -kings
+        kings ^= bit
+        sq = 0
+        while bit > 1:  # Square index of the bit (bit_length is not available under Numba)
+            bit >>= 1
+            sq += 1
+        if _capture_targets_kernel(sq, 3, opponent, occupied):
+            return True
+    return False
+
+
+def compile_kernels():
+    """
+    Compiles the board kernels, or loads them from Numba's cache, now rather than on their first use.
+    Compiling takes seconds, so the GUI calls this on a background thread at startup.
+    Does nothing without Numba.
+    """
+    if njit is None:
+        return
+    # Arguments of the types the game passes: the starting position's pawns
+    black = RANK_MASK[0] | RANK_MASK[1] | RANK_MASK[2]
+    white = RANK_MASK[5] | RANK_MASK[6] | RANK_MASK[7]
+    _move_targets_kernel(40, 1, black | white)
+    _capture_targets_kernel(40, 1, black, black | white)
+    _can_move_kernel(1, white, black, 0, 0)
+    _can_capture_kernel(1, white, black, 0, 0)
+
+
+@dataclass(slots=True)
+class Bitboards:
+    """Board state as four 64-bit masks, one per piece type."""
+    wp: int = 0  # White pawns
+    bp: int = 0  # Black pawns
+    wk: int = 0  # White kings
+    bk: int = 0  # Black kings
+    key: int = 0  # Zobrist key of the pieces, kept up to date by make_move
+    rotated_key: int = 0  # Zobrist key of the rotated twin, see ZOBRIST_ROTATED
+    score: int = 0  # Evaluation from white's point of view, kept up to date by make_move
+
+    def copy(self):
+        """Returns an independent copy of the bitboards."""
+        return Bitboards(self.wp, self.bp, self.wk, self.bk, self.key, self.rotated_key, self.score)
+
+    def pieces(self, player_type):
+        """Returns the mask of all pieces (pawns and kings) of player_type."""
+        return self.wp | self.wk if player_type == 1 else self.bp | self.bk
+
+    def occupied(self):
+        """Returns the mask of all occupied squares."""
+        return self.wp | self.bp | self.wk | self.bk
+
+    def toggle(self, piece, bits):
+        """Flips the given bits in the bitboard of the given piece code."""
+        if piece == 1:
+            self.wp ^= bits
+        elif piece == 2:
+            self.bp ^= bits
+        elif piece == 3:
+            self.wk ^= bits
+        elif piece == 4:
+            self.bk ^= bits
+
+    def piece_at(self, bit):
+        """Returns the piece code (see CheckersGameLogic._initialize_board) on the square given as a bit."""
+        if self.wp & bit:
+            return 1
+        if self.bp & bit:
+            return 2
+        if self.wk & bit:
+            return 3
+        if self.bk & bit:
+            return 4
+        return 0
+
+
 class CheckersGameLogic:
     # Mapping for AI search depth based on difficulty
     AI_SEARCH_DEPTH_MAP = {
@@ -9,6 +444,12 @@ class CheckersGameLogic:
         "Trudny": 5
     }
 
+    # Message shown when the game ends, indexed by the winning player
+    GAME_OVER_MESSAGES = {
+        1: "Koniec gry! Biali wygrywają! Brak ruchów dla czarnych.",
+        2: "Koniec gry! Czarni wygrywają! Brak ruchów dla białych."
+    }
+
     def __init__(self, ai_difficulty="Średni", player_color=1):
         self.ai_difficulty = ai_difficulty
         self.ai_search_depth = self.AI_SEARCH_DEPTH_MAP.get(ai_difficulty, 3)
@@ -20,25 +461,50 @@ class CheckersGameLogic:
         self.message = "Ruch białych."  # Message displayed to the user
         self.selected_piece_pos = None  # Position of the currently selected piece (row, col)
         self.forced_capture_piece = None  # Position of the piece that must perform a subsequent capture
+        # Zobrist key -> (depth, flag, value, best_move); values are for the player to move
+        self.transposition_table = {}
+        self.killers = None
+        self.history = None
+        self._clear_move_ordering()
+        # Result of the most recent get_all_possible_moves_for_player call, keyed by its position:
+        # ((wp, bp, wk, bk, player_type, forced_capture_piece), (moves_dict, has_moves_flag))
+        self._last_moves_cache = None
+
+    def _clear_move_ordering(self):
+        """
+        Resets the move ordering heuristics: quiet moves that caused a cut-off, per ply from the root
+        (two slots each), and history scores indexed [player_type][from_square][to_square].
+        """
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [[[0] * 64 for _ in range(64)] for _ in range(3)]
 
     def _initialize_board(self):
         """Initializes the game board with pieces in their starting positions."""
+        # Piece codes used throughout the game:
         # 0: empty square
         # 1: white pawn, 2: black pawn
         # 3: white king, 4: black king
-        board = [[0 for _ in range(8)] for _ in range(8)]
-        for r in range(8):
-            for c in range(8):
-                if (r + c) % 2 == 1:  # Only dark squares
-                    if r < 3:
-                        board[r][c] = 2  # Black pawns
-                    elif r > 4:
-                        board[r][c] = 1  # White pawns
+        # Black pawns take the dark squares of rows 0-2, white pawns those of rows 5-7.
+        black_rows = RANK_MASK[0] | RANK_MASK[1] | RANK_MASK[2]
+        white_rows = RANK_MASK[5] | RANK_MASK[6] | RANK_MASK[7]
+        board = Bitboards(wp=DARK_SQUARES & white_rows, bp=DARK_SQUARES & black_rows)
+        board.key = _compute_key(board)
+        board.rotated_key = _compute_key(board, ZOBRIST_ROTATED)
+        board.score = _evaluate_bitboards(board.wp, board.bp, board.wk, board.bk)
         return board
 
     def get_board_state(self):
-        """Returns the current state of the game board."""
-        return self.board
+        """
+        Returns the current state of the game board as a bytearray of 64 piece codes,
+        where the piece on (row, col) is at index row * 8 + col.
+        """
+        squares = bytearray(64)
+        for piece, bits in ((1, self.board.wp), (2, self.board.bp), (3, self.board.wk), (4, self.board.bk)):
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                squares[bit.bit_length() - 1] = piece
+        return squares
 
     def get_current_player(self):
         """Returns the current player (1 for white, 2 for black)."""
@@ -68,6 +534,10 @@ class CheckersGameLogic:
         self.message = "Ruch białych."
         self.selected_piece_pos = None
         self.forced_capture_piece = None
+        # Stored values are relative to the side to move and would stay valid, but entries left by the
+        # previous game would change the move ordering and so the choice between equally scored moves.
+        # A new game starts from an empty table, so the AI plays the same way in every game.
+        self.transposition_table.clear()
 
     def is_player_piece(self, row, col, player_type=None, board=None):
         """
@@ -80,11 +550,7 @@ class CheckersGameLogic:
         if player_type is None:
             player_type = self.current_player
 
-        piece = board[row][col]
-        if player_type == 1:  # White player
-            return piece == 1 or piece == 3  # White pawn or white king
-        else:  # Black player
-            return piece == 2 or piece == 4  # Black pawn or black king
+        return bool(board.pieces(player_type) & (1 << (row * 8 + col)))
 
     def is_opponent_piece(self, row, col, player_type=None, board=None):
         """
@@ -97,11 +563,7 @@ class CheckersGameLogic:
         if player_type is None:
             player_type = self.current_player
 
-        piece = board[row][col]
-        if player_type == 1:  # White player (opponent is black)
-            return piece == 2 or piece == 4
-        else:  # Black player (opponent is white)
-            return piece == 1 or piece == 3
+        return bool(board.pieces(2 if player_type == 1 else 1) & (1 << (row * 8 + col)))
 
     def get_possible_moves(self, r, c, board=None, player_type=None):
         """
@@ -114,41 +576,17 @@ class CheckersGameLogic:
         if player_type is None:
             player_type = self.current_player
 
-        moves = []
-        captures = []
-        piece = board[r][c]
-
         # Check for captures first (always prioritized in checkers)
         current_captures = self._get_captures_for_piece(r, c, board, player_type)
         if current_captures:
-            captures.extend(current_captures)
-            return captures, True  # Return captures and a flag indicating captures are found
+            return current_captures, True  # Return captures and a flag indicating captures are found
 
         # If no captures, check for normal moves
-        # Pawns (white and black)
-        if piece == 1 or piece == 2:
-            # Direction: -1 for white (upwards), 1 for black (downwards)
-            direction = -1 if piece == 1 else 1
-            # Check forward diagonal moves
-            for dc in [-1, 1]:
-                nr, nc = r + direction, c + dc
-                if 0 <= nr < 8 and 0 <= nc < 8 and board[nr][nc] == 0:
-                    moves.append((nr, nc))
-        # Kings (white and black)
-        elif piece == 3 or piece == 4:
-            # Kings can move diagonally in 4 directions
-            for dr in [-1, 1]:
-                for dc in [-1, 1]:
-                    for i in range(1, 8):  # Can move multiple squares
-                        nr, nc = r + dr * i, c + dc * i
-                        if 0 <= nr < 8 and 0 <= nc < 8:
-                            if board[nr][nc] == 0:
-                                moves.append((nr, nc))
-                            else:
-                                # Blocked by another piece, cannot pass further in this direction
-                                break
-                        else:
-                            break
+        sq = r * 8 + c
+        piece = board.piece_at(1 << sq)
+        if piece == 0:
+            return [], False
+        moves = _mask_to_positions(_move_targets_kernel(sq, piece, board.occupied()))
         return moves, False  # Return normal moves and a flag indicating no captures
 
     def _get_captures_for_piece(self, r, c, board=None, player_type=None):
@@ -161,63 +599,25 @@ class CheckersGameLogic:
         if player_type is None:
             player_type = self.current_player
 
-        captures = []
-        piece = board[r][c]
+        sq = r * 8 + c
+        piece = board.piece_at(1 << sq)
         if piece == 0:
             return []
 
-        # Possible capture directions for pawns and kings
-        directions = []
-        if piece == 1 or piece == 2:  # Pawns
-            direction_forward = -1 if piece == 1 else 1  # White moves up, black moves down
-            directions.append((direction_forward, -1))
-            directions.append((direction_forward, 1))
-        elif piece == 3 or piece == 4:  # Kings
-            directions.extend([(dr, dc) for dr in [-1, 1] for dc in [-1, 1]])  # All 4 diagonal directions
-
-        for dr, dc in directions:
-            if piece in [1, 2]:  # Pawns: capture by jumping 2 squares
-                nr, nc = r + dr, c + dc  # Square where a potential opponent piece is
-                n2r, n2c = r + 2 * dr, c + 2 * dc  # Square behind the opponent (destination)
-
-                if (0 <= n2r < 8 and 0 <= n2c < 8 and
-                        self.is_opponent_piece(nr, nc, player_type, board) and board[n2r][n2c] == 0):
-                    captures.append((n2r, n2c))
-            elif piece in [3, 4]:  # Kings: capture at a distance
-                opponent_found_on_path = None  # Stores the coordinates of the captured opponent piece
-
-                for i in range(1, 8):  # Iterate through squares in this diagonal direction
-                    nr, nc = r + dr * i, c + dc * i
-                    if not (0 <= nr < 8 and 0 <= nc < 8):
-                        break  # Out of bounds
-
-                    current_square_piece = board[nr][nc]
-
-                    if current_square_piece == 0:
-                        if opponent_found_on_path:  # If an opponent was already found, this empty square is a valid landing spot
-                            captures.append((nr, nc))
-                        # If no opponent found yet, just continue searching along this path
-                        continue
-                    elif self.is_player_piece(nr, nc, player_type, board):  # Own piece blocks the path
-                        break
-                    elif self.is_opponent_piece(nr, nc, player_type, board):  # Opponent piece found
-                        if opponent_found_on_path:  # Already captured an opponent, cannot capture another in the same jump
-                            break
-                        else:  # This is the first opponent piece found on this line
-                            opponent_found_on_path = (nr, nc)
-                            # Continue searching for empty landing spots *after* this captured piece
-                            continue
-                    else:  # Should not happen (e.g., piece type 5 or something unexpected)
-                        break
-        return captures
+        opponent = board.pieces(2 if player_type == 1 else 1)
+        return _mask_to_positions(_capture_targets_kernel(sq, piece, opponent, board.occupied()))
 
-    def get_all_possible_moves_for_player(self, board=None, player_type=None, forced_capture_piece=None):
+    def get_all_possible_moves_for_player(self, board: Bitboards | None = None, player_type: int | None = None,
+                                          forced_capture_piece: Position | None = None
+                                          ) -> tuple[dict[Position, list[Position]], bool]:
         """
         Returns a dictionary { (start_r, start_c): [(end_r, end_c), ...] }
-        for all possible moves and captures for the current player.
+        for all possible moves and captures for the current player, both in row-major order,
+        so callers need no sorting.
         If any captures are available, only captures are returned.
         Returns (moves_dict, has_forced_captures_flag).
         Can operate on a given board and for a given player_type for Minimax.
+        The dictionary and its lists belong to the caller, who may change them.
         """
         if board is None:
             board = self.board
@@ -226,33 +626,82 @@ class CheckersGameLogic:
         if forced_capture_piece is None:
             forced_capture_piece = self.forced_capture_piece  # Use game's actual forced capture piece by default
 
+        # A move is usually validated right after the GUI asked for the same position's moves
+        cache_key = (board.wp, board.bp, board.wk, board.bk, player_type, forced_capture_piece)
+        if self._last_moves_cache is not None and self._last_moves_cache[0] == cache_key:
+            return _copy_moves(self._last_moves_cache[1])
+
         all_player_moves = {}
         all_player_captures = {}
 
-        for r in range(8):
-            for c in range(8):
-                if self.is_player_piece(r, c, player_type, board):
-                    # If there's a forced capture piece, and this piece is NOT it, skip it.
-                    # This ensures that only the piece required to make a subsequent capture is considered.
-                    if forced_capture_piece and (r, c) != forced_capture_piece:
-                        continue
-
-                    moves_for_piece, has_captures = self.get_possible_moves(r, c, board, player_type)
-                    if moves_for_piece:
-                        if has_captures:
-                            all_player_captures[(r, c)] = moves_for_piece
-                        else:
-                            all_player_moves[(r, c)] = moves_for_piece
+        # Ownership and piece type are plain bit tests against masks computed once per call
+        if player_type == 1:
+            own_pawns, own_kings, opponent = board.wp, board.wk, board.bp | board.bk
+        else:
+            own_pawns, own_kings, opponent = board.bp, board.bk, board.wp | board.wk
+        occupied = own_pawns | own_kings | opponent
+        pawn, king = PAWN_CODE[player_type], KING_CODE[player_type]
+
+        # Visit only the player's own pieces, in row-major order
+        own_pieces = own_pawns | own_kings
+        if forced_capture_piece:
+            # Only the piece required to make a subsequent capture is considered.
+            own_pieces &= 1 << (forced_capture_piece[0] * 8 + forced_capture_piece[1])
+
+        while own_pieces:
+            bit = own_pieces & -own_pieces
+            own_pieces ^= bit
+            sq = bit.bit_length() - 1
+            piece = pawn if own_pawns & bit else king
+
+            # Captures are always prioritized; normal moves are only needed while no capture was found
+            targets = _capture_targets_kernel(sq, piece, opponent, occupied)
+            if targets:
+                all_player_captures[divmod(sq, 8)] = _mask_to_positions(targets)
+            elif not all_player_captures:
+                targets = _move_targets_kernel(sq, piece, occupied)
+                if targets:
+                    all_player_moves[divmod(sq, 8)] = _mask_to_positions(targets)
 
-        # print(f"DEBUG: get_all_possible_moves_for_player called for player_type={player_type}, forced_capture_piece={forced_capture_piece}")
         if all_player_captures:
-            # print(f"DEBUG: Player {player_type} has captures: {all_player_captures}")
-            return all_player_captures, True
+            result = all_player_captures, True
         else:
-            # print(f"DEBUG: Player {player_type} has no captures. Checking normal moves: {all_player_moves}")
             # Determine if there are *any* moves at all for the player
             overall_has_moves = bool(all_player_moves)  # True if all_player_moves is not empty, False otherwise
-            return all_player_moves, overall_has_moves
+            result = all_player_moves, overall_has_moves
+        self._last_moves_cache = (cache_key, result)
+        return _copy_moves(result)
+
+    def _has_any_move(self, board: Bitboards, player_type: int, forced_capture_piece: Position | None = None) -> bool:
+        """
+        Returns True as soon as one move or capture is found for player_type,
+        without building the full moves dictionary.
+        """
+        # Without a forced piece, whole-board step and jump tests answer without visiting the pieces
+        if not forced_capture_piece:
+            return (_can_move_kernel(player_type, board.wp, board.bp, board.wk, board.bk)
+                    or _can_capture_kernel(player_type, board.wp, board.bp, board.wk, board.bk))
+
+        if player_type == 1:
+            own_pawns, own_kings, opponent = board.wp, board.wk, board.bp | board.bk
+        else:
+            own_pawns, own_kings, opponent = board.bp, board.bk, board.wp | board.wk
+        occupied = own_pawns | own_kings | opponent
+        pawn, king = PAWN_CODE[player_type], KING_CODE[player_type]
+
+        # Only the piece required to make a subsequent capture is considered
+        own_pieces = own_pawns | own_kings
+        own_pieces &= 1 << (forced_capture_piece[0] * 8 + forced_capture_piece[1])
+
+        while own_pieces:
+            bit = own_pieces & -own_pieces
+            own_pieces ^= bit
+            sq = bit.bit_length() - 1
+            piece = pawn if own_pawns & bit else king
+            # A piece that must continue capturing normally has a capture, so captures are tried first
+            if _capture_targets_kernel(sq, piece, opponent, occupied) or _move_targets_kernel(sq, piece, occupied):
+                return True
+        return False
 
     def is_move_valid(self, start_pos, end_pos):
         """
@@ -262,34 +711,22 @@ class CheckersGameLogic:
         start_r, start_c = start_pos
         end_r, end_c = end_pos
 
-        # print(f"\n--- DEBUG: is_move_valid called for move: {start_pos} -> {end_pos} ---")
-        # print(f"DEBUG: current_player: {self.current_player}, forced_capture_piece: {self.forced_capture_piece}")
-        # print("DEBUG: Current Board State:")
-        # for r_dbg in range(8):
-        #     print(f"DEBUG: {self.board[r_dbg]}")
-        # print("--------------------------------------------------")
-
         if not (0 <= start_r < 8 and 0 <= start_c < 8 and
                 0 <= end_r < 8 and 0 <= end_c < 8):
             self.message = "Ruch poza planszą."
-            # print(f"DEBUG: {self.message}")
             return False
 
-        piece = self.board[start_r][start_c]
-        if piece == 0 or not self.is_player_piece(start_r, start_c):
+        if not self.is_player_piece(start_r, start_c):
             self.message = "Na wybranym polu nie ma twojego pionka."
-            # print(f"DEBUG: {self.message}")
             return False
 
-        if self.board[end_r][end_c] != 0:
+        if self.board.occupied() & (1 << (end_r * 8 + end_c)):
             self.message = "Pole docelowe jest zajęte."
-            # print(f"DEBUG: {self.message}")
             return False
 
         # Check if the selected piece must continue capturing
         if self.forced_capture_piece and self.forced_capture_piece != start_pos:
             self.message = "Musisz kontynuować bicie tym samym pionkiem!"
-            # print(f"DEBUG: {self.message}")
             return False
 
         # Get all valid moves for the current player based on the current board state and forced capture rule
@@ -298,7 +735,6 @@ class CheckersGameLogic:
             player_type=self.current_player,
             forced_capture_piece=self.forced_capture_piece  # Pass the current forced_capture_piece
         )
-        # print(f"DEBUG: all_valid_moves for validation: {all_valid_moves}, has_forced_captures: {has_forced_captures}")
 
         # Check if the intended move (start_pos -> end_pos) is among the valid moves.
         # This covers both normal moves and all allowed captures (including multiple jumps).
@@ -315,25 +751,24 @@ class CheckersGameLogic:
             else:
                 # No captures are available, but the chosen move is not a valid normal move.
                 self.message = "Niepoprawny ruch. (Pamiętaj o biciach, jeśli są dostępne!)"
-            # print(f"DEBUG: {self.message}")
             return False
 
-        # print("DEBUG: Move is valid.")
         return True
 
-    def make_move(self, start_pos, end_pos, board=None, player_type=None):
+    def make_move(self, start_pos: Position, end_pos: Position, board: Bitboards | None = None,
+                  player_type: int | None = None) -> bool | tuple[Bitboards, int, Position | None, bool]:
         """
         Executes a move on the board (or a copy of board for minimax).
         Handles capturing, promotion, and updates current player/forced capture state.
         Returns (new_board, new_player_type, new_forced_capture_piece, is_capture_made).
         If board/player_type are None, operates on self.board/self.current_player.
         """
-        # Create a deep copy of the board to avoid modifying the original during simulation
+        # Copy the bitboards to avoid modifying the original during simulation
         if board is None:
-            temp_board = [row[:] for row in self.board]
+            temp_board = self.board.copy()
             is_main_game_move = True
         else:
-            temp_board = [row[:] for row in board]
+            temp_board = board.copy()
             is_main_game_move = False
 
         # Use provided player_type or current game player
@@ -342,78 +777,10 @@ class CheckersGameLogic:
         else:
             current_player_for_move = player_type
 
-        start_r, start_c = start_pos
-        end_r, end_c = end_pos
-        piece_type = temp_board[start_r][start_c]
-
-        dr_abs = abs(end_r - start_r)
-        dc_abs = abs(end_c - start_c)
-
-        dr = (end_r - start_r) // dr_abs if dr_abs > 0 else 0
-        dc = (end_c - start_c) // dc_abs if dc_abs > 0 else 0
-
-        is_capture = False
-
-        # Check if the move is a capture (distance > 1 implies capture in checkers)
-        if dr_abs > 1 or dc_abs > 1:  # If move involves jumping over at least one square
-            is_capture = True
-            # Find and remove the first opponent piece along the jump path
-            captured_r, captured_c = None, None
-
-            # Iterate from start_pos towards end_pos, one step at a time
-            current_r, current_c = start_r, start_c
-            while True:
-                current_r += dr
-                current_c += dc
-
-                if current_r == end_r and current_c == end_c:
-                    # Reached the destination, no more pieces to check on path,
-                    # or the captured piece was the last one before end_pos.
-                    break
-
-                if not (0 <= current_r < 8 and 0 <= current_c < 8):
-                    break  # Out of bounds
-
-                if self.is_opponent_piece(current_r, current_c, current_player_for_move, temp_board):
-                    captured_r, captured_c = current_r, current_c
-                    # print(f"DEBUG: Captured piece found at ({captured_r}, {captured_c})")
-                    break  # Found the piece to be captured, break from finding opponent
-
-                elif temp_board[current_r][current_c] != 0:  # Blocked by own piece or another piece that isn't opponent
-                    # print(f"DEBUG: Path unexpectedly blocked by piece at ({current_r}, {current_c}).")
-                    captured_r = None  # Invalidate capture if path is unexpectedly blocked
-                    break
-
-            if captured_r is not None:
-                temp_board[captured_r][captured_c] = 0  # Remove the captured piece
-                # print(f"DEBUG: Removed captured piece at ({captured_r}, {captured_c})")
-            else:
-                # print("DEBUG: No opponent found to capture on path. This implies an invalid capture move was attempted.")
-                is_capture = False  # Ensure is_capture is False if no piece was actually captured
-
-        # Execute the piece's move
-        temp_board[end_r][end_c] = piece_type
-        temp_board[start_r][start_c] = 0
-        # print(f"DEBUG: Moved piece from ({start_r}, {start_c}) to ({end_r}, {end_c})")
-
-        # Check for promotion on the temporary board
-        promoted_from_pawn = 0
-        if temp_board[end_r][end_c] == 1 and end_r == 0:
-            temp_board[end_r][end_c] = 3  # White king
-            promoted_from_pawn = 1
-            # print(f"DEBUG: Piece promoted to white king at ({end_r}, {end_c})")
-        elif temp_board[end_r][end_c] == 2 and end_r == 7:
-            temp_board[end_r][end_c] = 4  # Black king
-            promoted_from_pawn = 2
-            # print(f"DEBUG: Piece promoted to black king at ({end_r}, {end_c})")
-
-        new_forced_capture_piece = None
-        if is_capture:
-            # Check if the same piece can perform further captures on the temporary board
-            remaining_captures = self._get_captures_for_piece(end_r, end_c, temp_board, current_player_for_move)
-            if remaining_captures:
-                new_forced_capture_piece = (end_r, end_c)
-                # print(f"DEBUG: Remaining captures found for ({end_r}, {end_c}): {remaining_captures}")
+        next_player_type, new_forced_capture_mask, is_capture, undo = self.make_move_inplace(
+            start_pos, end_pos, temp_board, current_player_for_move)
+        # The piece that must continue capturing is the one that just landed on end_pos
+        new_forced_capture_piece = end_pos if new_forced_capture_mask else None
 
         # Update main game state if this is not a minimax simulation
         if is_main_game_move:
@@ -423,201 +790,474 @@ class CheckersGameLogic:
                 self.message = "Musisz kontynuować bicie!"
             else:
                 self.forced_capture_piece = None
-                self.current_player = 1 if current_player_for_move == 2 else 2
+                self.current_player = next_player_type
                 self.message = f"Ruch {'białych' if self.current_player == 1 else 'czarnych'}."
 
-            if promoted_from_pawn:
+            if undo.promoted:
                 self.message = "Pionek został promowany na damkę!" + (" " + self.message if self.message else "")
 
             return True  # Indicates move was made successfully
 
         else:  # For minimax simulation, return the new state
-            next_player_type = current_player_for_move
-            if not is_capture or not new_forced_capture_piece:
-                next_player_type = 1 if current_player_for_move == 2 else 2
-
             # Return new board state, next player, new forced capture, and if a capture was made
             return temp_board, next_player_type, new_forced_capture_piece, is_capture
 
-    def _evaluate_board(self, board, current_ai_player_type):
+    def make_move_inplace(self, start_pos: Position, end_pos: Position, board: Bitboards,
+                          player_type: int) -> tuple[int, int, bool, Undo]:
         """
-        Evaluates the current board state for the AI player.
-        Positive values are good for AI, negative for opponent.
+        Executes a move directly on board for player_type, leaving the game state untouched.
+        Minimax pairs it with unmake_move instead of copying the board for every simulated move.
+        Returns (new_player_type, new_forced_capture_mask, is_capture_made, undo), where the mask
+        holds the bit of the piece that must continue capturing, or is 0.
         """
-        score = 0
-        opponent_player_type = 1 if current_ai_player_type == 2 else 2
+        start_sq = start_pos[0] * 8 + start_pos[1]
+        end_sq = end_pos[0] * 8 + end_pos[1]
 
-        for r in range(8):
-            for c in range(8):
-                piece = board[r][c]
-                if piece == 0:
-                    continue
+        # Any opponent piece on the diagonal between start and end is the one being jumped
+        captured = BETWEEN_MASK[start_sq * 64 + end_sq] & board.pieces(2 if player_type == 1 else 1)
+        if not captured:
+            return (1 if player_type == 2 else 2), 0, False, self.apply_slide_inplace(board, start_sq, end_sq)
 
-                if (current_ai_player_type == 1 and (piece == 1 or piece == 3)) or \
-                        (current_ai_player_type == 2 and (piece == 2 or piece == 4)):  # AI's pieces
-                    if piece == 1 or piece == 2:  # Pawn
-                        score += 10
-                        # Bonus for advancing pawns (for white, moving to lower rows is good; for black, higher rows)
-                        if current_ai_player_type == 1:  # White AI
-                            score += (7 - r)  # Max 7 for r=0, min 0 for r=7
-                        else:  # Black AI
-                            score += r  # Max 7 for r=7, min 0 for r=0
-                    elif piece == 3 or piece == 4:  # King
-                        score += 30  # Kings are more valuable
-                elif (opponent_player_type == 1 and (piece == 1 or piece == 3)) or \
-                        (opponent_player_type == 2 and (piece == 2 or piece == 4)):  # Opponent's pieces
-                    if piece == 1 or piece == 2:  # Pawn
-                        score -= 10
-                        # Penalize opponent's advancing pawns
-                        if opponent_player_type == 1:  # White Opponent
-                            score -= (7 - r)
-                        else:  # Black Opponent
-                            score -= r
-                    elif piece == 3 or piece == 4:  # King
-                        score -= 30
-        return score
-
-    def _minimax(self, board, depth, maximizing_player, alpha, beta, current_ai_player_type,
-                 original_forced_capture_piece):
-        """
-        Minimax algorithm with Alpha-Beta pruning to find the best move.
-        maximizing_player: True if current node is for the AI (maximizing player), False for opponent.
-        current_ai_player_type: The type of the AI player (1 or 2).
-        original_forced_capture_piece: The piece that was forced to capture at the start of this minimax branch.
-                                       This helps maintain capture rules across recursive calls.
-        """
-        # Base case: reached max depth or game over
-        # Note: self.check_game_over for minimax needs to be careful about whose turn it is in the simulation
-        # It takes player_type, so it knows which player has no moves.
-        sim_player_type_for_game_over_check = current_ai_player_type if maximizing_player else (
-            1 if current_ai_player_type == 2 else 2)
-        if depth == 0 or self.check_game_over(board, sim_player_type_for_game_over_check,
-                                              original_forced_capture_piece):
-            return self._evaluate_board(board, current_ai_player_type)
-
-        # Determine whose turn it is in the current simulation step
-        sim_player_type = current_ai_player_type if maximizing_player else (1 if current_ai_player_type == 2 else 2)
-
-        possible_moves_dict, has_forced_captures = self.get_all_possible_moves_for_player(board, sim_player_type,
-                                                                                          original_forced_capture_piece)
-
-        if not possible_moves_dict:  # No moves available for the current player in simulation
-            return self._evaluate_board(board, current_ai_player_type)
-
-        if maximizing_player:
-            max_eval = float('-inf')
-            # Iterate through all possible moves (including forced captures if applicable)
-            for start_pos, end_positions in possible_moves_dict.items():
-                for end_pos in end_positions:
-                    # Simulate the move on a temporary board
-                    new_board, next_player_type_after_move, new_forced_capture, is_capture = self.make_move(start_pos,
-                                                                                                            end_pos,
-                                                                                                            board,
-                                                                                                            sim_player_type)
-
-                    if is_capture and new_forced_capture:  # If capture and needs to continue
-                        # Same player, same depth, but with the new forced_capture_piece for the next recursive call
-                        eval = self._minimax(new_board, depth, maximizing_player, alpha, beta, current_ai_player_type,
-                                             new_forced_capture)
-                    else:
-                        # Opponent's turn, reduce depth
-                        eval = self._minimax(new_board, depth - 1, False, alpha, beta, current_ai_player_type, None)
-
-                    max_eval = max(max_eval, eval)
-                    alpha = max(alpha, eval)
-                    if beta <= alpha:
-                        break  # Beta cut-off
-                if beta <= alpha:
-                    break
-            return max_eval
-        else:  # Minimizing player
-            min_eval = float('inf')
-            # Iterate through all possible moves (including forced captures if applicable)
-            for start_pos, end_positions in possible_moves_dict.items():
-                for end_pos in end_positions:
-                    # Simulate the move on a temporary board
-                    new_board, next_player_type_after_move, new_forced_capture, is_capture = self.make_move(start_pos,
-                                                                                                            end_pos,
-                                                                                                            board,
-                                                                                                            sim_player_type)
-
-                    if is_capture and new_forced_capture:  # If capture and needs to continue
-                        # Same player, same depth, but with the new forced_capture_piece
-                        eval = self._minimax(new_board, depth, maximizing_player, alpha, beta, current_ai_player_type,
-                                             new_forced_capture)
-                    else:
-                        # Maximizing player's turn, reduce depth
-                        eval = self._minimax(new_board, depth - 1, True, alpha, beta, current_ai_player_type, None)
-
-                    min_eval = min(min_eval, eval)
-                    beta = min(beta, eval)
-                    if beta <= alpha:
-                        break  # Alpha cut-off
-                if beta <= alpha:
-                    break
-            return min_eval
+        new_forced_capture_mask, undo = self.apply_capture_inplace(board, start_sq, end_sq,
+                                                                   captured.bit_length() - 1, player_type)
+        # If the same piece can perform further captures, the turn does not pass
+        next_player_type = player_type if new_forced_capture_mask else (1 if player_type == 2 else 2)
+        return next_player_type, new_forced_capture_mask, True, undo
+
+    def apply_slide_inplace(self, board: Bitboards, start_sq: int, end_sq: int) -> Undo:
+        """
+        Moves a piece from start_sq to the empty end_sq without capturing, promoting a pawn that
+        reaches the last row. Returns the undo record for unmake_move.
+        """
+        moved_piece = board.piece_at(1 << start_sq)
+        # Pawn code + 2 is the king code
+        promoted = (moved_piece == 1 and end_sq < 8) or (moved_piece == 2 and end_sq >= 56)
+        landed_piece = moved_piece + 2 if promoted else moved_piece
+        board.toggle(moved_piece, 1 << start_sq)
+        board.toggle(landed_piece, 1 << end_sq)
+        board.key ^= ZOBRIST[moved_piece][start_sq] ^ ZOBRIST[landed_piece][end_sq]
+        board.rotated_key ^= ZOBRIST_ROTATED[moved_piece][start_sq] ^ ZOBRIST_ROTATED[landed_piece][end_sq]
+        board.score += PIECE_SQUARE_SCORE[landed_piece][end_sq] - PIECE_SQUARE_SCORE[moved_piece][start_sq]
+        return Undo(moved_piece, start_sq, end_sq, 0, 0, promoted)
+
+    def apply_capture_inplace(self, board: Bitboards, start_sq: int, end_sq: int, captured_sq: int,
+                              player_type: int) -> tuple[int, Undo]:
+        """
+        Jumps player_type's piece from start_sq to end_sq, removing the opponent piece on captured_sq.
+        Returns (new_forced_capture_mask, undo); the mask holds the bit of end_sq when the same piece
+        can capture again, otherwise it is 0.
+        """
+        captured_piece = board.piece_at(1 << captured_sq)
+        board.toggle(captured_piece, 1 << captured_sq)
+        board.key ^= ZOBRIST[captured_piece][captured_sq]
+        board.rotated_key ^= ZOBRIST_ROTATED[captured_piece][captured_sq]
+        board.score -= PIECE_SQUARE_SCORE[captured_piece][captured_sq]
+
+        undo = self.apply_slide_inplace(board, start_sq, end_sq)._replace(captured_piece=captured_piece,
+                                                                          captured_sq=captured_sq)
+        # Promotion happens before checking for further captures, as in the game itself
+        landed_piece = undo.moved_piece + 2 if undo.promoted else undo.moved_piece
+        if _capture_targets_kernel(end_sq, landed_piece, board.pieces(2 if player_type == 1 else 1),
+                                   board.occupied()):
+            return 1 << end_sq, undo
+        return 0, undo
+
+    def unmake_move(self, board: Bitboards, undo: Undo) -> None:
+        """Takes back a move made on board by make_move_inplace."""
+        landed_piece = undo.moved_piece + 2 if undo.promoted else undo.moved_piece
+        board.toggle(landed_piece, 1 << undo.to_sq)
+        board.toggle(undo.moved_piece, 1 << undo.from_sq)
+        board.key ^= ZOBRIST[undo.moved_piece][undo.from_sq] ^ ZOBRIST[landed_piece][undo.to_sq]
+        board.rotated_key ^= (ZOBRIST_ROTATED[undo.moved_piece][undo.from_sq]
+                              ^ ZOBRIST_ROTATED[landed_piece][undo.to_sq])
+        board.score -= PIECE_SQUARE_SCORE[landed_piece][undo.to_sq] - PIECE_SQUARE_SCORE[undo.moved_piece][undo.from_sq]
+        if undo.captured_piece:
+            board.toggle(undo.captured_piece, 1 << undo.captured_sq)
+            board.key ^= ZOBRIST[undo.captured_piece][undo.captured_sq]
+            board.rotated_key ^= ZOBRIST_ROTATED[undo.captured_piece][undo.captured_sq]
+            board.score += PIECE_SQUARE_SCORE[undo.captured_piece][undo.captured_sq]
+
+    def _evaluate_board(self, board: Bitboards, player_type: int) -> int:
+        """
+        Evaluates the current board state for player_type, the player to move in the negamax search.
+        Positive values are good for player_type, negative for the opponent.
+        """
+        # The score is maintained incrementally (from white's point of view) by the in-place moves
+        return board.score if player_type == 1 else -board.score
+
+    def _minimax(self, board: Bitboards, depth: int, alpha: float, beta: float, player_type: int,
+                 forced_capture_mask: int, ply: int) -> float:
+        """
+        Negamax algorithm with Alpha-Beta pruning and principal variation search to find the best move.
+        Returns the value of board for player_type, the player to move in it:
+        positive values are good for player_type, negative for the opponent.
+        forced_capture_mask: Bit of the piece that must continue capturing in this position, or 0.
+        ply: Number of moves played since the root position.
+        """
+        # Base case: reached max depth, only pending captures are still played out
+        if depth == 0:
+            return self._qsearch(board, alpha, beta, player_type, forced_capture_mask, ply)
+
+        # Probe the transposition table
+        key, rotated = _search_key(board, player_type, forced_capture_mask)
+        entry = self.transposition_table.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, flag, value, _ = entry
+            # Wins and losses are stored relative to the position, see the store below
+            if value >= WIN_THRESHOLD:
+                value -= ply
+            elif value <= -WIN_THRESHOLD:
+                value += ply
+            if flag == TT_EXACT:
+                return value
+            if flag == TT_LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                return value
+        alpha_orig, beta_orig = alpha, beta
+
+        # The best move of an entry stored for the rotated twin is turned back to this position
+        tt_move = None
+        if entry is not None:
+            tt_move = _rotate_move(entry[3]) if rotated else entry[3]
 
-    def get_ai_move(self):
+        # Moves are generated lazily, most promising first, so a cut-off also skips generating the rest
+        ordered_moves = self.iter_ordered_moves(board, player_type, forced_capture_mask, ply, tt_move)
+
+        opponent_type = 1 if player_type == 2 else 2
+        best_move = None
+        best_eval = NEG_INF
+        # Methods called for every move, looked up once per node
+        minimax, apply_capture, apply_slide, unmake_move = (self._minimax, self.apply_capture_inplace,
+                                                            self.apply_slide_inplace, self.unmake_move)
+        for start_pos, end_pos, captured_sq in ordered_moves:
+            # Simulate the move on the board itself and take it back after searching it.
+            # Captures already know the jumped square from move generation.
+            start_sq, end_sq = start_pos[0] * 8 + start_pos[1], end_pos[0] * 8 + end_pos[1]
+            is_capture = captured_sq is not None
+            if captured_sq is not None:
+                new_forced_capture, undo = apply_capture(board, start_sq, end_sq, captured_sq, player_type)
+            else:
+                new_forced_capture, undo = 0, apply_slide(board, start_sq, end_sq)
+
+            # The first move gets the full window; the others are only proven not to beat alpha with a
+            # null window and are searched again with the full window when they unexpectedly do.
+            if new_forced_capture:
+                # Same player, with the new forced_capture_mask for the next recursive call
+                if best_move is not None:
+                    eval = minimax(board, depth - 1, alpha, alpha + 1, player_type, new_forced_capture, ply + 1)
+                if best_move is None or alpha < eval < beta:
+                    eval = minimax(board, depth - 1, alpha, beta, player_type, new_forced_capture, ply + 1)
+            elif (depth == 1 and not _can_capture_kernel(opponent_type, board.wp, board.bp, board.wk, board.bk)
+                  and (not is_capture or (board.bp | board.bk if player_type == 1 else board.wp | board.wk))):
+                # A quiet position at the horizon is evaluated here, without the calls to _minimax and
+                # _qsearch that would only return this evaluation (from the opponent's side).
+                # A capture of the last opposing piece is left to _qsearch, which scores it as a win.
+                eval = board.score if player_type == 1 else -board.score
+            else:
+                # Other player's turn, reduce depth
+                if best_move is not None:
+                    eval = -minimax(board, depth - 1, -alpha - 1, -alpha, opponent_type, 0, ply + 1)
+                if best_move is None or alpha < eval < beta:
+                    eval = -minimax(board, depth - 1, -beta, -alpha, opponent_type, 0, ply + 1)
+
+            unmake_move(board, undo)
+
+            if eval > best_eval:
+                best_eval = eval
+                best_move = (start_pos, end_pos)
+            if eval > alpha:
+                alpha = eval
+
+            if alpha >= beta:  # Beta cut-off
+                if not is_capture:
+                    # Remember the quiet move that refuted this position for sibling positions
+                    killers = self.killers[ply]
+                    if killers[0] != (start_pos, end_pos):
+                        killers[1] = killers[0]
+                        killers[0] = (start_pos, end_pos)
+                    self.history[player_type][start_sq][end_sq] += depth * depth
+                break
+
+        if best_move is None:  # No moves available for the current player in simulation: the game is lost
+            return -(WIN_SCORE - ply)
+
+        # Store the result: a value outside the original (alpha, beta) window is only a bound
+        if best_eval <= alpha_orig:
+            flag = TT_UPPER
+        elif best_eval >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        # Depth-preferred replacement: an entry from a deeper search of this position is kept
+        if entry is None or entry[0] <= depth:
+            if len(self.transposition_table) >= TT_MAX_ENTRIES:
+                self.transposition_table.clear()
+            # A win or loss is stored as the plies from this position to it, since the position can be
+            # reached at other plies from the root
+            stored_eval = best_eval
+            if best_eval >= WIN_THRESHOLD:
+                stored_eval += ply
+            elif best_eval <= -WIN_THRESHOLD:
+                stored_eval -= ply
+            self.transposition_table[key] = (depth, flag, stored_eval,
+                                             _rotate_move(best_move) if rotated else best_move)
+        return best_eval
+
+    def _qsearch(self, board: Bitboards, alpha: float, beta: float, player_type: int,
+                 forced_capture_mask: int, ply: int) -> float:
+        """
+        Quiescence search: plays out the captures pending at the search horizon, so that positions
+        are only evaluated once no capture is available. Captures are mandatory, so a position with
+        captures cannot be evaluated as it stands. Returns the value for player_type like _minimax.
+        """
+        # Most positions at the horizon are quiet, which a whole-board capture test detects quickly
+        if not forced_capture_mask and not _can_capture_kernel(player_type, board.wp, board.bp, board.wk, board.bk):
+            # A capture sequence that took the last pieces of player_type ends the game
+            if not (board.wp | board.wk if player_type == 1 else board.bp | board.bk):
+                return -(WIN_SCORE - ply)
+            return self._evaluate_board(board, player_type)
+
+        opponent_type = 1 if player_type == 2 else 2
+        best_eval = None
+        for start_sq, end_sq, captured_sq in self._iter_captures(board, player_type, forced_capture_mask):
+            new_forced_capture, undo = self.apply_capture_inplace(board, start_sq, end_sq, captured_sq, player_type)
+            if new_forced_capture:  # The same piece keeps capturing
+                eval = self._qsearch(board, alpha, beta, player_type, new_forced_capture, ply + 1)
+            else:
+                eval = -self._qsearch(board, -beta, -alpha, opponent_type, 0, ply + 1)
+            self.unmake_move(board, undo)
+
+            if best_eval is None or eval > best_eval:
+                best_eval = eval
+            if eval > alpha:
+                alpha = eval
+            if alpha >= beta:
+                break
+
+        if best_eval is None:  # No capture available: the position is quiet
+            return self._evaluate_board(board, player_type)
+        return best_eval
+
+    def _iter_captures(self, board: Bitboards, player_type: int,
+                       forced_capture_mask: int) -> Iterator[tuple[int, int, int]]:
+        """
+        Yields the captures available to player_type as (start_sq, end_sq, captured_sq),
+        where captured_sq is the square of the jumped piece.
+        The board must be back in its original state whenever the next capture is requested.
+        """
+        if player_type == 1:
+            own_pawns, own_kings, opponent = board.wp, board.wk, board.bp | board.bk
+        else:
+            own_pawns, own_kings, opponent = board.bp, board.bk, board.wp | board.wk
+        occupied = own_pawns | own_kings | opponent
+        pawn, king = PAWN_CODE[player_type], KING_CODE[player_type]
+
+        pieces = own_pawns | own_kings
+        if forced_capture_mask:
+            pieces &= forced_capture_mask
+
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            sq = bit.bit_length() - 1
+            targets = _capture_targets_kernel(sq, pawn if own_pawns & bit else king, opponent, occupied)
+            while targets:
+                target = targets & -targets
+                targets ^= target
+                to_sq = target.bit_length() - 1
+                # The jumped piece is the only opponent piece between the two squares
+                yield sq, to_sq, (BETWEEN_MASK[sq * 64 + to_sq] & opponent).bit_length() - 1
+
+    def iter_ordered_moves(self, board: Bitboards, player_type: int, forced_capture_mask: int, ply: int,
+                           tt_move: Move | None) -> Iterator[tuple[Position, Position, int | None]]:
+        """
+        Yields the (start_pos, end_pos, captured_sq) moves of player_type best-first
+        (captured_sq is None for normal moves): transposition table move, captures (most valuable victim
+        first), promotions, killer moves, then quiet moves by history score.
+        Captures are mandatory, so they are always generated first; when there are none, the transposition
+        table move is tried before the quiet moves are generated at all.
+        The board must be back in its original state whenever the next move is requested.
+        """
+        if player_type == 1:
+            own_pawns, own_kings, opponent = board.wp, board.wk, board.bp | board.bk
+        else:
+            own_pawns, own_kings, opponent = board.bp, board.bk, board.wp | board.wk
+        occupied = own_pawns | own_kings | opponent
+        pawn, king = PAWN_CODE[player_type], KING_CODE[player_type]
+        promotion_row = 0 if player_type == 1 else 7
+        history = self.history[player_type]
+
+        own_pieces = own_pawns | own_kings
+        if forced_capture_mask:
+            # Only the piece required to make a subsequent capture is considered.
+            own_pieces &= forced_capture_mask
+
+        # Captures are scored straight from the capture generator, without collecting them first
+        scored_moves: list[tuple[int, tuple[Position, Position, int | None]]] = []
+        for from_sq, to_sq, captured_sq in self._iter_captures(board, player_type, forced_capture_mask):
+            start_pos, end_pos = divmod(from_sq, 8), divmod(to_sq, 8)
+            # Most valuable victim first, taken with the least valuable piece
+            score = MVV_LVA_SCORE[board.piece_at(1 << captured_sq)][board.piece_at(1 << from_sq)]
+            if (start_pos, end_pos) == tt_move:
+                score += ORDER_TT_MOVE
+            if own_pawns & (1 << from_sq) and to_sq >> 3 == promotion_row:
+                score += ORDER_PROMOTION
+            scored_moves.append((score, (start_pos, end_pos, captured_sq)))
+        if scored_moves:
+            if len(scored_moves) > 1:  # Usually there is a single capture to make
+                scored_moves.sort(key=ORDER_KEY, reverse=True)
+            for _, move in scored_moves:
+                yield move
+            return
+
+        # A transposition table move that is a legal quiet move here can be tried before generating the others
+        if tt_move is not None:
+            from_bit = 1 << (tt_move[0][0] * 8 + tt_move[0][1])
+            if own_pieces & from_bit and _move_targets_kernel(
+                    tt_move[0][0] * 8 + tt_move[0][1], pawn if own_pawns & from_bit else king,
+                    occupied) & (1 << (tt_move[1][0] * 8 + tt_move[1][1])):
+                yield tt_move[0], tt_move[1], None
+            else:
+                tt_move = None
+
+        killers = self.killers[ply]
+        pieces = own_pieces
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            sq = bit.bit_length() - 1
+            is_pawn = own_pawns & bit
+            targets = _move_targets_kernel(sq, pawn if is_pawn else king, occupied)
+            while targets:
+                target = targets & -targets
+                targets ^= target
+                to_sq = target.bit_length() - 1
+                start_pos, end_pos = divmod(sq, 8), divmod(to_sq, 8)
+                if (start_pos, end_pos) == tt_move:
+                    continue
+                score = history[sq][to_sq]
+                if is_pawn and to_sq >> 3 == promotion_row:
+                    score += ORDER_PROMOTION
+                if (start_pos, end_pos) in killers:
+                    score += ORDER_KILLER
+                scored_moves.append((score, (start_pos, end_pos, None)))
+        scored_moves.sort(key=ORDER_KEY, reverse=True)
+        for _, move in scored_moves:
+            yield move
+
+    def get_ai_move(self, should_stop=None):
         """
         Determines the best move for the AI (black player) using Minimax with Alpha-Beta pruning.
         Returns a tuple (start_pos, end_pos) or None if no move is possible.
+        should_stop: Optional function called between root moves, e.g. from another thread's request;
+        when it returns True the search ends early with the best move found so far.
         """
+        # The search works on a snapshot of the position: with the AI searching on its own thread,
+        # a new game can replace self.board while the search is still running
+        board = self.board.copy()
         current_ai_player_type = self.current_player  # AI is always current player when this is called
-        best_eval = float('-inf')
-        best_move = None
+        forced_capture_mask = _position_mask(self.forced_capture_piece)
+
+        # Killer moves and history scores only describe positions of the current search
+        self._clear_move_ordering()
+
+        # Root moves start in move-ordering order. The previous search usually reached this position
+        # already, so its best move from the transposition table is tried first.
+        key, rotated = _search_key(board, current_ai_player_type, forced_capture_mask)
+        entry = self.transposition_table.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = _rotate_move(entry[3]) if rotated else entry[3]
+        root_moves = [(start_pos, end_pos) for start_pos, end_pos, _ in self.iter_ordered_moves(
+            board, current_ai_player_type, forced_capture_mask, 0, tt_move)]
+
+        if not root_moves:
+            self.message = "AI nie ma dostępnych ruchów."
+            return None, None  # AI cannot move
 
-        # print(f"AI: Current player {current_ai_player_type}, forced_capture_piece: {self.forced_capture_piece}")
-        # print(f"AI: Board state at start of get_ai_move: {self.board}")
+        # Iterative deepening: every completed depth provides the score to center the next search's
+        # aspiration window on and the scores to order the root moves by at the next depth.
+        deadline = time.monotonic() + AI_TIME_BUDGET
+        best_move, best_eval = root_moves[0], None
+        for depth in range(1, self.ai_search_depth + 1):
+            if best_eval is None:
+                alpha, beta = NEG_INF, POS_INF
+            else:
+                alpha, beta = best_eval - ASPIRATION_WINDOW, best_eval + ASPIRATION_WINDOW
+            # The first iteration always completes, so there is a move to play however short the budget
+            iteration_deadline = deadline if depth > 1 else None
+
+            root_scores = self._search_root(board, root_moves, depth, alpha, beta, current_ai_player_type,
+                                             iteration_deadline, should_stop)
+            if root_scores is not None and best_eval is not None and not alpha < max(root_scores.values()) < beta:
+                # Fail-low or fail-high: the score is only a bound, so search again with a full window
+                root_scores = self._search_root(board, root_moves, depth, NEG_INF, POS_INF,
+                                                current_ai_player_type, iteration_deadline, should_stop)
+            if root_scores is None:  # Out of time or stopped: keep the result of the deepest completed iteration
+                break
+
+            # Best first; the stable sort keeps the earlier of equally scored moves in front.
+            # Moves not searched after an immediate win go last.
+            root_moves.sort(key=lambda move: root_scores.get(move, NEG_INF), reverse=True)
+            best_move = root_moves[0]
+            best_eval = root_scores[best_move]
+            # A forced win within this depth is the quickest one, searching deeper cannot improve on it.
+            # Wins found by the quiescence search beyond it may still be beaten by a blocking win.
+            if best_eval >= WIN_SCORE - depth or time.monotonic() >= deadline:
+                break
 
-        # Get all possible moves for the current AI player
-        possible_moves, has_forced_captures = self.get_all_possible_moves_for_player(self.board, current_ai_player_type,
-                                                                                     self.forced_capture_piece)
-        # print(f"AI: Possible moves for AI: {possible_moves}, has_forced_captures: {has_forced_captures}")
+        return best_move
 
-        if not possible_moves:
-            self.message = "AI nie ma dostępnych ruchów."
-            # print("AI: No possible moves found for AI.")
-            return None, None  # AI cannot move
+    def _search_root(self, board, root_moves, depth, alpha, beta, current_ai_player_type, deadline, should_stop):
+        """
+        Searches every root move of board to the given depth with the (alpha, beta) window.
+        The moves are made and taken back on board itself, which is left as it was.
+        Returns a dictionary { (start_pos, end_pos): eval }, or None if the deadline passed or
+        should_stop (see get_ai_move) returned True before all moves were searched.
+        """
+        root_scores = {}
+        search_root_move = self._search_root_move
+        for start_pos, end_pos in root_moves:
+            eval = search_root_move(board, start_pos, end_pos, current_ai_player_type, depth, alpha, beta)
+
+            root_scores[(start_pos, end_pos)] = eval
+            if eval >= WIN_SCORE - 1:  # Winning with this very move cannot be bettered
+                break
+            # Later moves only need to be proven no better than the best one so far, which cuts them off early.
+            # Their scores are then upper bounds, which still rank them below the best move.
+            if eval > alpha:
+                alpha = eval
+            if alpha >= beta:
+                # Fail-high: the aspiration window is searched again with a full window, and the later
+                # moves must not be searched with an inverted window, whose bounds would be stored wrongly
+                break
+            if (deadline is not None and time.monotonic() >= deadline) or (should_stop is not None and should_stop()):
+                return None
+        return root_scores
+
+    def _search_root_move(self, board, start_pos, end_pos, current_ai_player_type, depth, alpha, beta):
+        """
+        Plays the AI's move start_pos -> end_pos on board, returns its minimax value
+        and takes the move back again.
+        """
+        next_player_type_after_move, new_forced_capture, is_capture, undo = \
+            self.make_move_inplace(start_pos, end_pos, board, current_ai_player_type)
 
-        # If there are forced captures, we must only consider those moves
-        moves_to_evaluate = {}
-        if has_forced_captures:
-            if self.forced_capture_piece and self.forced_capture_piece in possible_moves:
-                moves_to_evaluate[self.forced_capture_piece] = possible_moves[self.forced_capture_piece]
-            else:  # If has_forced_captures is True but no specific forced_capture_piece set yet (first capture)
-                moves_to_evaluate = possible_moves
+        # If AI made a capture and must continue, its turn continues
+        if is_capture and new_forced_capture:
+            eval = self._minimax(board, depth - 1, alpha, beta, current_ai_player_type, new_forced_capture, 1)
         else:
-            moves_to_evaluate = possible_moves
-
-        # Sort moves for consistent AI behavior (optional, but good for reproducibility)
-        sorted_start_positions = sorted(moves_to_evaluate.keys())
-
-        for start_pos in sorted_start_positions:
-            end_positions = sorted(moves_to_evaluate[start_pos])  # Sort end positions too
-            for end_pos in end_positions:
-                # Simulate the move
-                new_board, next_player_type_after_move, new_forced_capture, is_capture = \
-                    self.make_move(start_pos, end_pos, self.board, current_ai_player_type)
-
-                # If AI made a capture and must continue, its turn continues, so depth doesn't decrease for minimax
-                if is_capture and new_forced_capture:
-                    eval = self._minimax(new_board, self.ai_search_depth, True, float('-inf'), float('inf'),
-                                         current_ai_player_type, new_forced_capture)
-                else:
-                    # Opponent's turn (minimizing player)
-                    eval = self._minimax(new_board, self.ai_search_depth - 1, False, float('-inf'), float('inf'),
-                                         current_ai_player_type, None)
-
-                # print(f"AI: Evaluating move {start_pos} -> {end_pos}, Eval: {eval}")
-
-                if eval > best_eval:
-                    best_eval = eval
-                    best_move = (start_pos, end_pos)
-
-        # print(f"AI: Best move found: {best_move} with eval: {best_eval}")
-        return best_move
+            # Opponent's turn: its value for the opponent is the negated value for the AI
+            eval = -self._minimax(board, depth - 1, -beta, -alpha, next_player_type_after_move, 0, 1)
 
-    def check_game_over(self, board=None, player_type=None, forced_capture_piece=None):
+        self.unmake_move(board, undo)
+        return eval
+
+    def check_game_over(self, board: Bitboards | None = None, player_type: int | None = None,
+                        forced_capture_piece: Position | None = None) -> bool:
         """
         Checks if the game has ended (current player has no valid moves).
         Can operate on a given board and for a given player_type for Minimax.
@@ -629,16 +1269,59 @@ class CheckersGameLogic:
         if forced_capture_piece is None:
             forced_capture_piece = self.forced_capture_piece
 
-        all_moves_available, has_any_moves = self.get_all_possible_moves_for_player(board, player_type,
-                                                                                    forced_capture_piece)
-
-        # print(f"DEBUG_GAME_OVER: Player {player_type} moves dict: {all_moves_available}, has_any_moves: {has_any_moves}, forced_capture_piece: {forced_capture_piece}")
+        cached = self._last_moves_cache
+        if cached is not None and cached[0] == (board.wp, board.bp, board.wk, board.bk, player_type,
+                                                forced_capture_piece):
+            has_any_moves = cached[1][1]
+        else:
+            has_any_moves = self._has_any_move(board, player_type, forced_capture_piece)
 
         if not has_any_moves and not forced_capture_piece:
             winning_player = 1 if player_type == 2 else 2  # The other player wins
             if board is self.board:  # Only update game_logic's message if it's the main board
-                self.message = f"Koniec gry! {'Biali' if winning_player == 1 else 'Czarni'} wygrywają! Brak ruchów dla {'czarnych' if player_type == 2 else 'białych'}."
-            # print(f"DEBUG_GAME_OVER: Game is OVER for player {player_type}.")
+                self.message = self.GAME_OVER_MESSAGES[winning_player]
             return True
-        # print(f"DEBUG_GAME_OVER: Game is NOT over for player {player_type}.")
         return False
+
+
+def _check_kernels(games=20, seed=1):
+    """
+    Compiles the board kernels with Numba and compares them with their plain Python versions
+    on the positions of random games. Run with `python game_logic.py` after changing a kernel
+    or one of the tables it reads; without Numba there is nothing to compare.
+    """
+    if not hasattr(_can_capture_kernel, "py_func"):  # Numba is missing or disabled with NUMBA_DISABLE_JIT
+        print("The board kernels are not compiled, they run as plain Python.")
+        return
+
+    compile_kernels()
+    rnd = random.Random(seed)
+    positions = 0
+    for _ in range(games):
+        game = CheckersGameLogic()
+        while not game.check_game_over():
+            board = game.board
+            pieces = (board.wp, board.bp, board.wk, board.bk)
+            occupied = board.occupied()
+            for player_type in (1, 2):
+                for kernel in (_can_move_kernel, _can_capture_kernel):
+                    assert kernel(player_type, *pieces) == kernel.py_func(player_type, *pieces), pieces
+                opponent = board.pieces(2 if player_type == 1 else 1)
+                for sq in range(64):
+                    if not DARK_SQUARES >> sq & 1:
+                        continue
+                    for piece in (PAWN_CODE[player_type], KING_CODE[player_type]):
+                        assert (_move_targets_kernel(sq, piece, occupied)
+                                == _move_targets_kernel.py_func(sq, piece, occupied)), (pieces, sq, piece)
+                        assert (_capture_targets_kernel(sq, piece, opponent, occupied)
+                                == _capture_targets_kernel.py_func(sq, piece, opponent, occupied)), (pieces, sq, piece)
+            positions += 1
+
+            moves, _ = game.get_all_possible_moves_for_player()
+            start_pos = rnd.choice(list(moves))
+            game.make_move(start_pos, rnd.choice(moves[start_pos]))
+    print(f"Compiled board kernels match the Python versions in {positions} positions.")
+
+
+if __name__ == '__main__':
+    _check_kernels()
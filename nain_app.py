@@ -2,131 +2,302 @@
 # This file contains the graphical user interface for the checkers game.
 
 import sys
+import threading
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QGridLayout, QLabel,
+    QApplication, QWidget, QLabel,
     QVBoxLayout, QPushButton, QMessageBox, QHBoxLayout,
     QDialog, QComboBox, QRadioButton, QButtonGroup
 )
-from PyQt6.QtGui import QColor, QBrush, QPainter
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer
+from PyQt6.QtGui import QColor, QBrush, QPainter, QPainterPath, QPixmap, QPalette
+from PyQt6.QtCore import Qt, QSize, QRect, pyqtSignal, QThread, QTimer
 
 # Import the game logic from the separate file
-from game_logic import CheckersGameLogic
+from game_logic import CheckersGameLogic, compile_kernels
+
+
+# Rendered pieces, keyed by piece type. There are only four of them, all drawn at the square size,
+# so each is drawn once and every repaint of a square only copies the pixmap.
+# The king's star is cached under the key "star" and shared by both kings.
+_PIECE_PIXMAPS = {}
+
+# Outline of a pawn within its square, shared by both colors
+_PAWN_PATH = QPainterPath()
+_PAWN_PATH.addEllipse(5, 5, 50, 50)
+
+
+def _new_piece_pixmap():
+    """Returns an empty transparent 60x60 pixmap with an antialiased painter open on it."""
+    # Drawn at the screen's pixel density, so pieces stay sharp on high-DPI displays
+    ratio = QApplication.instance().devicePixelRatio()
+    pixmap = QPixmap(round(60 * ratio), round(60 * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    return pixmap, painter
+
+
+def _get_star_pixmap():
+    """Returns the king's gold star, shaped and rendered through the font system only once."""
+    pixmap = _PIECE_PIXMAPS.get("star")
+    if pixmap is None:
+        pixmap, painter = _new_piece_pixmap()
+        painter.setPen(QColor(255, 215, 0))  # Gold color
+        font = painter.font()
+        font.setPointSize(24)
+        painter.setFont(font)
+        painter.drawText(0, 0, 60, 60, Qt.AlignmentFlag.AlignCenter, "★")
+        painter.end()
+        _PIECE_PIXMAPS["star"] = pixmap
+    return pixmap
+
+
+def _get_piece_pixmap(piece_type):
+    """Returns the pixmap of piece_type (1-4) on a transparent 60x60 background, drawing it on first use."""
+    pixmap = _PIECE_PIXMAPS.get(piece_type)
+    if pixmap is not None:
+        return pixmap
+
+    if piece_type in (3, 4):
+        # A king is its color's pawn with the star drawn over it
+        pixmap = _get_piece_pixmap(piece_type - 2).copy()
+        painter = QPainter(pixmap)
+        painter.drawPixmap(0, 0, _get_star_pixmap())
+    else:
+        # Pawns: white with a grey outline, black with a lighter outline; filled and outlined in one pass
+        pixmap, painter = _new_piece_pixmap()
+        if piece_type == 1:
+            painter.setBrush(QBrush(QColor(255, 255, 255)))  # White
+            painter.setPen(QColor(100, 100, 100))  # Grey outline
+        else:
+            painter.setBrush(QBrush(QColor(0, 0, 0)))  # Black
+            painter.setPen(QColor(150, 150, 150))  # Lighter grey outline
+        painter.drawPath(_PAWN_PATH)
+    painter.end()
+
+    _PIECE_PIXMAPS[piece_type] = pixmap
+    return pixmap
 
 
-# Class representing a single square on the board
-class CheckersSquare(QLabel):
-    # Signal emitted when the square is clicked
+# Widget showing the whole board: all 64 squares and their pieces are painted by a single paintEvent
+class CheckersBoard(QWidget):
+    # Signal emitted when a square is clicked
     clicked = pyqtSignal(int, int)
 
-    def __init__(self, row, col, parent=None):
+    SQUARE_SIZE = 60
+    # Background colors shared by all squares
+    SELECTED_COLOR = QColor("lightblue")  # Selection color
+    HIGHLIGHT_COLOR = QColor("#A3D900")  # Highlight color for possible moves
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.row = row
-        self.col = col
-        self.setFixedSize(60, 60)  # Square size
+        self.setFixedSize(8 * self.SQUARE_SIZE, 8 * self.SQUARE_SIZE)
         self.setMouseTracking(True)  # Enable mouse tracking for hover/leave events
-        # 0: empty, 1: white pawn, 2: black pawn, 3: white king, 4: black king
-        self.piece_type = 0
-        self.is_selected = False  # True if this square's piece is selected
-        self.is_highlighted = False  # True if this square is a possible move destination
-        # Colors for light and dark squares (using Hex for ease)
-        self.original_color = QColor("#D18B47") if (row + col) % 2 == 0 else QColor("#FFCE9E")
-
-        self.update_background()
-
-    def update_background(self):
-        """Updates the square's background color based on its state."""
-        if self.is_selected:
-            self.setStyleSheet(f"background-color: lightblue;")  # Selection color
-        elif self.is_highlighted:
-            self.setStyleSheet(f"background-color: #A3D900;")  # Highlight color for possible moves
-        else:
-            self.setStyleSheet(f"background-color: {self.original_color.name()};")
+        # The board paints its whole area itself, so Qt neither clears it first nor repaints it on resize,
+        # and no system background is drawn for it when it is shown
+        self.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        # Painted through Qt's back buffer, never directly on screen, so a repaint never flickers
+        self.setAttribute(Qt.WidgetAttribute.WA_PaintOnScreen, False)
+
+        # Square state, indexed row * 8 + col like the game logic's board state.
+        # Pieces: 0: empty, 1: white pawn, 2: black pawn, 3: white king, 4: black king
+        self.pieces = bytearray(64)
+        self.highlighted = set()  # Indices of the squares that are possible move destinations
+        self.selected = None  # Index of the square whose piece is selected
+        self.hovered = None  # Index of the square under the mouse
+        # Colors for light and dark squares (using Hex for ease), and a slightly darker hover color
+        self.square_colors = [QColor("#D18B47") if (index // 8 + index % 8) % 2 == 0 else QColor("#FFCE9E")
+                              for index in range(64)]
+        self.hover_colors = [color.darker(120) for color in self.square_colors]
+        # Area of each square on the board, built once for repaints and the paint loop
+        size = self.SQUARE_SIZE
+        self.square_rects = [QRect(index % 8 * size, index // 8 * size, size, size) for index in range(64)]
+        self._base_pixmap = None  # The empty board in its square colors, see _get_base_pixmap
+
+    def _get_base_pixmap(self):
+        """
+        Returns the empty board with every square in its own color, rendered once.
+        It is rendered again only if the widget moves to a screen with a different pixel density.
+        """
+        ratio = self.devicePixelRatioF()
+        if self._base_pixmap is None or self._base_pixmap.devicePixelRatio() != ratio:
+            pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            painter = QPainter(pixmap)
+            for index in range(64):
+                painter.fillRect(self.square_rects[index], self.square_colors[index])
+            painter.end()
+            self._base_pixmap = pixmap
+        return self._base_pixmap
+
+    def update_square(self, index):
+        """Schedules a repaint of the square with the given index only (None is ignored)."""
+        if index is not None:
+            self.update(self.square_rects[index])
+
+    def set_pieces(self, board_state):
+        """
+        Sets the pieces of all squares from the game logic's board state.
+        Only the squares whose piece changed (usually two to four per move) are repainted.
+        """
+        pieces = self.pieces
+        if pieces == board_state:  # Compared in one go; nothing to repaint, e.g. after a rejected move
+            return
+        for index in range(64):
+            if pieces[index] != board_state[index]:
+                pieces[index] = board_state[index]
+                self.update_square(index)
+
+    def set_selected(self, pos):
+        """Marks the square at pos (row, col) as selected, or clears the selection if pos is None."""
+        self.update_square(self.selected)
+        self.selected = pos[0] * 8 + pos[1] if pos is not None else None
+        self.update_square(self.selected)
+
+    def highlight(self, row, col):
+        """Marks the square as highlighted (possible move)."""
+        self.highlighted.add(row * 8 + col)
+        self.update_square(row * 8 + col)
 
-    def set_piece(self, piece_type):
-        """Sets the type of piece on this square and triggers a repaint."""
-        self.piece_type = piece_type
-        self.update()  # Force repaint
+    def clear_highlights(self):
+        """Removes highlights from all squares, visiting only the few that are highlighted."""
+        for index in self.highlighted:
+            self.update_square(index)
+        self.highlighted.clear()
+
+    def _square_at(self, point):
+        """Returns the index of the square at point, or None if it lies outside the board."""
+        row, col = int(point.y()) // self.SQUARE_SIZE, int(point.x()) // self.SQUARE_SIZE
+        if 0 <= row < 8 and 0 <= col < 8:
+            return row * 8 + col
+        return None
 
     def mousePressEvent(self, event):
-        """Handles mouse clicks on the square."""
+        """Handles mouse clicks on the board."""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.row, self.col)
-
-    def enterEvent(self, event):
-        """Event for mouse entering the square."""
-        if not self.is_selected and not self.is_highlighted:
-            # Slightly darker hover color
-            self.setStyleSheet(f"background-color: {self.original_color.darker(120).name()};")
+            index = self._square_at(event.position())
+            if index is not None:
+                self.clicked.emit(index // 8, index % 8)
+
+    def mouseMoveEvent(self, event):
+        """Tracks the square under the mouse for the hover color."""
+        # Called for every mouse movement over the board: nothing else happens until the mouse
+        # reaches another square
+        index = self._square_at(event.position())
+        if index != self.hovered:
+            self.update_square(self.hovered)
+            self.hovered = index
+            self.update_square(index)
 
     def leaveEvent(self, event):
-        """Event for mouse leaving the square."""
-        self.update_background()  # Restore original color
-
-    def select(self):
-        """Marks the square as selected."""
-        self.is_selected = True
-        self.update_background()
-
-    def deselect(self):
-        """Marks the square as not selected."""
-        self.is_selected = False
-        self.update_background()
-
-    def highlight(self):
-        """Marks the square as highlighted (possible move)."""
-        self.is_highlighted = True
-        self.update_background()
-
-    def unhighlight(self):
-        """Marks the square as not highlighted."""
-        self.is_highlighted = False
-        self.update_background()
+        """Event for mouse leaving the board."""
+        self.update_square(self.hovered)
+        self.hovered = None  # Restore original color
 
     def paintEvent(self, event):
-        """Custom painting for pieces on the square."""
-        super().paintEvent(event)  # Draw QLabel background first
+        """
+        Custom painting of the squares that need it: the empty board first, then the background
+        of squares in another state and the pieces.
+        """
+        size = self.SQUARE_SIZE
+        region = event.region()
+        # Only the rows and columns within the repainted area are visited, usually a single square
+        bounds = region.boundingRect()
+        rows = range(max(bounds.top() // size, 0), min(bounds.bottom() // size, 7) + 1)
+        cols = range(max(bounds.left() // size, 0), min(bounds.right() // size, 7) + 1)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # One copy of the empty board; the painter is clipped to the repainted region
+        painter.drawPixmap(0, 0, self._get_base_pixmap())
+        for row in rows:
+            for col in cols:
+                index = row * 8 + col
+                rect = self.square_rects[index]
+                if not region.intersects(rect):
+                    continue  # Square not exposed or changed, its previous painting is kept
+                if index == self.selected:
+                    color = self.SELECTED_COLOR
+                elif index in self.highlighted:
+                    color = self.HIGHLIGHT_COLOR
+                elif index == self.hovered:
+                    color = self.hover_colors[index]
+                else:
+                    color = None  # Already painted by the empty board
+                if color is not None:
+                    painter.fillRect(rect, color)
+                # Drawing pawns and kings from their cached pixmaps
+                piece_type = self.pieces[index]
+                if piece_type:
+                    painter.drawPixmap(rect.topLeft(), _get_piece_pixmap(piece_type))
+        painter.end()
+
+
+# Thread running the AI's search, so the window stays responsive while the AI thinks
+class AISearchThread(QThread):
+    # Signal emitted with (search_id, start_pos, end_pos) when the search is done;
+    # the positions are None if the AI has no move
+    move_found = pyqtSignal(int, object, object)
+
+    def __init__(self, game_logic, parent=None):
+        super().__init__(parent)
+        self.game_logic = game_logic
+        self.search_id = 0  # Set by the GUI before each start, returned with the result
 
-        # Drawing pawns and kings
-        if self.piece_type == 1:  # White pawn
-            painter.setBrush(QBrush(QColor(255, 255, 255)))  # White
-            painter.drawEllipse(5, 5, 50, 50)  # Draw circle
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.setPen(QColor(100, 100, 100))  # Grey outline
-            painter.drawEllipse(5, 5, 50, 50)
-        elif self.piece_type == 2:  # Black pawn
-            painter.setBrush(QBrush(QColor(0, 0, 0)))  # Black
-            painter.drawEllipse(5, 5, 50, 50)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.setPen(QColor(150, 150, 150))  # Lighter grey outline
-            painter.drawEllipse(5, 5, 50, 50)
-        elif self.piece_type == 3:  # White king
-            painter.setBrush(QBrush(QColor(255, 255, 255)))
-            painter.drawEllipse(5, 5, 50, 50)
-            painter.setPen(QColor(100, 100, 100))
-            painter.drawEllipse(5, 5, 50, 50)
-            # Draw star for king
-            painter.setPen(QColor(255, 215, 0))  # Gold color
-            font = painter.font()
-            font.setPointSize(24)
-            painter.setFont(font)
-            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "★")
-        elif self.piece_type == 4:  # Black king
-            painter.setBrush(QBrush(QColor(0, 0, 0)))
-            painter.drawEllipse(5, 5, 50, 50)
-            painter.setPen(QColor(150, 150, 150))
-            painter.drawEllipse(5, 5, 50, 50)
-            painter.setPen(QColor(255, 215, 0))  # Gold color
-            font = painter.font()
-            font.setPointSize(24)
-            painter.setFont(font)
-            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "★")
+    def run(self):
+        """Searches the AI's move in the current game state."""
+        # requestInterruption() ends the search after the root move it is searching
+        ai_start_pos, ai_end_pos = self.game_logic.get_ai_move(self.isInterruptionRequested)
+        self.move_found.emit(self.search_id, ai_start_pos, ai_end_pos)
 
 
 # Main application window class
 class CheckersGameGUI(QWidget):
+    AI_MOVE_DELAY_MS = 500  # How long the AI's selected piece is shown before its move is made
+
+    # Style of the new game dialog: a slightly brighter background, bold labels, radio button text
+    # in black for better readability, a gray combo box and a blue start button
+    NEW_GAME_DIALOG_STYLE = """
+        * {
+            background-color: darkgray;
+            border-radius: 10px;
+        }
+        QLabel {
+            font-weight: bold;
+            margin-bottom: 5px;
+        }
+        QRadioButton {
+            color: black;
+        }
+        QComboBox {
+            border: 1px solid gray;
+            border-radius: 5px;
+            padding: 5px;
+            background: gray;
+            selection-background-color: #A3D900;
+        }
+        QComboBox::drop-down {
+            subcontrol-origin: padding;
+            subcontrol-position: top right;
+            width: 20px;
+            border-left-width: 1px;
+            border-left-color: darkgray;
+            border-left-style: solid;
+            border-top-right-radius: 3px;
+            border-bottom-right-radius: 3px;
+        }
+        QPushButton {
+            background-color: #2196F3; /* Blue */
+            color: white;
+            border-radius: 8px;
+            padding: 8px 15px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #0B7CD8;
+        }
+    """
+
     def __init__(self):
         super().__init__()
         # Initialize game logic with default settings
@@ -135,13 +306,31 @@ class CheckersGameGUI(QWidget):
         self.setGeometry(100, 100, 8 * 60 + 80, 8 * 60 + 120)
 
         self.board_size = 8
-        self.board_widgets = {}
-        self.selected_square = None
+        self.selected_square = None  # Position (row, col) of the selected piece
         self.possible_moves_for_selected = []
 
         self.ai_timer = QTimer(self)
         self.ai_timer.setSingleShot(True)
         self.ai_timer.timeout.connect(self.make_ai_move)
+        # Delay between showing the AI's move and making it; one timer reused for every AI move
+        self.ai_move_timer = QTimer(self)
+        self.ai_move_timer.setSingleShot(True)
+        self.ai_move_timer.setInterval(self.AI_MOVE_DELAY_MS)
+        self.ai_move_timer.timeout.connect(self._run_pending_ai_move)
+
+        self.ai_thread = AISearchThread(self.game_logic, self)
+        self.ai_thread.move_found.connect(self._ai_move_found)
+        self.ai_thread.finished.connect(self._ai_thread_finished)
+        self._ai_search_waiting = False  # An AI turn waits for the abandoned game's search to end
+        self.ai_search_id = 0  # Increased by a new game, so results of an abandoned search are ignored
+        self._pending_ai_move = None  # (start_pos, end_pos) of the AI move shown but not yet made
+        self._new_game_dialog = None  # Built on the first "Nowa Gra" click and reused afterwards
+        self._new_game_difficulty_combo = None  # Widgets of that dialog, set and read on every showing
+        self._new_game_color_group = None
+
+        # With Numba the board kernels are compiled before their first use, which takes seconds on the first
+        # launch; a background thread does it while the window is shown and the player thinks about a move
+        threading.Thread(target=compile_kernels, daemon=True).start()
 
         self.init_ui()
         self.update_board_display()
@@ -150,8 +339,6 @@ class CheckersGameGUI(QWidget):
     def init_ui(self):
         """Initializes the main UI layout and widgets."""
         main_layout = QVBoxLayout()
-        board_layout = QGridLayout()
-        board_layout.setSpacing(0)
 
         # Column labels (A-H) at the top
         col_labels_top = QHBoxLayout()
@@ -172,14 +359,10 @@ class CheckersGameGUI(QWidget):
                 QLabel(f"<b>{8 - r}</b>", alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter))
         board_with_row_labels.addLayout(row_labels_left)
 
-        # Add board squares
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                square = CheckersSquare(row, col, self)
-                square.clicked.connect(self.square_clicked)
-                board_layout.addWidget(square, row, col)
-                self.board_widgets[(row, col)] = square
-        board_with_row_labels.addLayout(board_layout)
+        # Add the board
+        self.board_widget = CheckersBoard(self)
+        self.board_widget.clicked.connect(self.square_clicked)
+        board_with_row_labels.addWidget(self.board_widget)
 
         # Row labels (8-1) on the right
         row_labels_right = QVBoxLayout()
@@ -202,7 +385,21 @@ class CheckersGameGUI(QWidget):
         # Additional UI elements
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-top: 10px;")
+        self.status_label.setContentsMargins(0, 10, 0, 0)
+        # The label changes colour and size with every status update. Fonts and palettes are built once
+        # here and only swapped later, instead of having a style sheet parsed on every update.
+        self.status_font = self.status_label.font()
+        self.status_font.setPixelSize(16)
+        self.status_font.setBold(True)
+        self.game_over_font = self.status_label.font()
+        self.game_over_font.setPixelSize(18)
+        self.game_over_font.setBold(True)
+        self.status_palettes = {}
+        for key, color in ((1, "#00008B"), (2, "#8B0000"), ("game_over", "#800080")):
+            palette = self.status_label.palette()
+            palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+            self.status_palettes[key] = palette
+        self.status_label.setFont(self.status_font)
         main_layout.addWidget(self.status_label)
 
         reset_button = QPushButton("Nowa Gra")
@@ -220,209 +417,221 @@ class CheckersGameGUI(QWidget):
 
     def update_board_display(self):
         """Updates the visual state of the board based on the game logic's board state."""
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                piece_type = self.game_logic.get_board_state()[row][col]
-                self.board_widgets[(row, col)].set_piece(piece_type)
+        self.board_widget.set_pieces(self.game_logic.get_board_state())
 
     def update_status(self):
         """Updates the status label text and color."""
-        self.status_label.setText(self.game_logic.get_message())
-        # Change status label color based on current player's turn
-        if self.game_logic.get_current_player() == 1:  # White player
-            self.status_label.setStyleSheet(
-                "font-size: 16px; font-weight: bold; margin-top: 10px; color: #00008B;")  # Darker blue
-        else:  # Black player
-            self.status_label.setStyleSheet(
-                "font-size: 16px; font-weight: bold; margin-top: 10px; color: #8B0000;")  # Darker red
-
-        # Special styling for game over message
-        if "Koniec gry!" in self.game_logic.get_message():
-            self.status_label.setStyleSheet(
-                "font-size: 18px; font-weight: bold; margin-top: 10px; color: #800080;")  # Darker purple
+        message = self.game_logic.get_message()
+        self.status_label.setText(message)
+        # Special styling for game over message: larger and darker purple
+        if "Koniec gry!" in message:
+            self.status_label.setPalette(self.status_palettes["game_over"])
+            self.status_label.setFont(self.game_over_font)
+        else:
+            # Status label color based on current player's turn: darker blue for white, darker red for black
+            self.status_label.setPalette(self.status_palettes[self.game_logic.get_current_player()])
+            self.status_label.setFont(self.status_font)
 
     def clear_highlights(self):
         """Removes highlights from all squares."""
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                self.board_widgets[(row, col)].unhighlight()
+        self.board_widget.clear_highlights()
 
     def highlight_possible_moves(self, moves):
         """Highlights the squares specified in the 'moves' list."""
         for r, c in moves:
-            self.board_widgets[(r, c)].highlight()
+            self.board_widget.highlight(r, c)
+
+    def select_square(self, pos):
+        """Selects the piece at pos (row, col) on the board, or clears the selection if pos is None."""
+        self.selected_square = pos
+        self.board_widget.set_selected(pos)
 
     def square_clicked(self, row, col):
         """Handles a click event on a game square."""
         clicked_pos = (row, col)
+        # Looked up once per click; the player's color does not change during a game
+        game_logic = self.game_logic
+        player_color = game_logic.get_player_color()
 
         # If the game is over, do not allow moves
-        if "Koniec gry!" in self.game_logic.get_message():
-            QMessageBox.information(self, "Koniec Gry", self.game_logic.get_message())
+        message = game_logic.get_message()
+        if "Koniec gry!" in message:
+            QMessageBox.information(self, "Koniec Gry", message)
             return
 
         # Determine if it's the human player's turn
         is_human_turn = False
-        if self.game_logic.get_current_player() == self.game_logic.get_player_color():
+        if game_logic.get_current_player() == player_color:
             is_human_turn = True
 
         if not is_human_turn:
-            self.game_logic.message = "Czekaj na ruch AI..."
+            game_logic.message = "Czekaj na ruch AI..."
             self.update_status()
             return
 
         # Handle forced captures - if a piece is forced to capture, only that piece can be selected
-        if self.game_logic.forced_capture_piece:
+        if game_logic.forced_capture_piece:
             if self.selected_square is None:  # First click in a forced capture sequence
-                if clicked_pos == self.game_logic.forced_capture_piece:
-                    self.selected_square = self.board_widgets[clicked_pos]
-                    self.selected_square.select()
-                    self.game_logic.selected_piece_pos = clicked_pos
+                if clicked_pos == game_logic.forced_capture_piece:
+                    self.select_square(clicked_pos)
+                    game_logic.selected_piece_pos = clicked_pos
                     # Highlight possible further captures for this piece
-                    possible_captures, _ = self.game_logic.get_possible_moves(row, col)
+                    possible_captures, _ = game_logic.get_possible_moves(row, col)
                     self.possible_moves_for_selected = possible_captures
                     self.highlight_possible_moves(self.possible_moves_for_selected)
                     self.update_status()
                     return  # Wait for the next click (the destination for the capture)
                 else:
-                    self.game_logic.message = "Musisz kontynuować bicie tym samym pionkiem!"
+                    game_logic.message = "Musisz kontynuować bicie tym samym pionkiem!"
                     self.update_status()
                     return
 
         if self.selected_square is None:
             # First click - select a piece
-            if self.game_logic.is_player_piece(row, col, player_type=self.game_logic.get_player_color()):
+            if game_logic.is_player_piece(row, col, player_type=player_color):
                 # Check for any forced captures for the current player across the whole board
-                all_possible_moves, has_forced_captures = self.game_logic.get_all_possible_moves_for_player(
-                    board=self.game_logic.get_board_state(),
-                    player_type=self.game_logic.get_player_color(),
+                all_possible_moves, has_forced_captures = game_logic.get_all_possible_moves_for_player(
+                    board=game_logic.board,
+                    player_type=player_color,
                     forced_capture_piece=None  # Check all pieces initially
                 )
 
                 if has_forced_captures and clicked_pos not in all_possible_moves:
-                    self.game_logic.message = "Musisz wykonać bicie innym pionkiem!"
+                    game_logic.message = "Musisz wykonać bicie innym pionkiem!"
                     self.update_status()
                     return
 
-                self.selected_square = self.board_widgets[clicked_pos]
-                self.selected_square.select()
-                self.game_logic.selected_piece_pos = clicked_pos
+                self.select_square(clicked_pos)
+                game_logic.selected_piece_pos = clicked_pos
 
                 # Highlight possible moves/captures for the selected piece
-                moves_for_selected_piece, _ = self.game_logic.get_possible_moves(row, col,
-                                                                                 board=self.game_logic.get_board_state(),
-                                                                                 player_type=self.game_logic.get_player_color())
+                moves_for_selected_piece, _ = game_logic.get_possible_moves(row, col,
+                                                                            board=game_logic.board,
+                                                                            player_type=player_color)
                 self.possible_moves_for_selected = moves_for_selected_piece
                 self.highlight_possible_moves(self.possible_moves_for_selected)
 
-                self.game_logic.message = (
+                game_logic.message = (
                     f"Wybrano pionek na polu: ({chr(ord('A') + col)}{8 - row}). Wybierz pole docelowe."
                 )
                 self.update_status()
             else:
-                self.game_logic.message = "Na wybranym polu nie ma twojego pionka."
+                game_logic.message = "Na wybranym polu nie ma twojego pionka."
                 self.update_status()
         else:
             # Second click - attempt to make a move
-            start_pos = self.game_logic.selected_piece_pos
+            start_pos = game_logic.selected_piece_pos
 
             # If the same piece is clicked again, deselect it
             if clicked_pos == start_pos:
-                if self.selected_square:  # Deselect if it's currently selected
-                    self.selected_square.deselect()
-                self.selected_square = None
-                self.game_logic.selected_piece_pos = None
+                self.select_square(None)
+                game_logic.selected_piece_pos = None
                 self.clear_highlights()
-                self.game_logic.message = "Anulowano wybór."
+                game_logic.message = "Anulowano wybór."
                 self.update_status()
                 return
 
             # Validate the move using game logic
-            if self.game_logic.is_move_valid(start_pos, clicked_pos):
-                self.game_logic.make_move(start_pos, clicked_pos)  # Make move in logic
+            if game_logic.is_move_valid(start_pos, clicked_pos):
+                game_logic.make_move(start_pos, clicked_pos)  # Make move in logic
                 self.update_board_display()  # Refresh board view
 
                 # Check for game over conditions first, then update status
-                game_over = self.game_logic.check_game_over()
+                game_over = game_logic.check_game_over()
                 self.update_status()  # Update status to reflect any new game over message
 
                 if game_over:
                     # Game is over, clear selection
-                    if self.selected_square:  # Ensure selected_square is not None before calling deselect
-                        self.selected_square.deselect()
-                    self.selected_square = None
-                    self.game_logic.selected_piece_pos = None
+                    self.select_square(None)
+                    game_logic.selected_piece_pos = None
                     self.clear_highlights()
-                    QMessageBox.information(self, "Koniec Gry", self.game_logic.get_message())
-                elif self.game_logic.forced_capture_piece:
+                    QMessageBox.information(self, "Koniec Gry", game_logic.get_message())
+                elif game_logic.forced_capture_piece:
                     # If there's a forced capture, the piece remains selected
                     # and we update highlights for next possible jumps.
-                    self.game_logic.selected_piece_pos = self.game_logic.forced_capture_piece
+                    game_logic.selected_piece_pos = game_logic.forced_capture_piece
                     # Re-select the piece for the next jump.
-                    # We might need to deselect the previous selected_square if it's different.
-                    if self.selected_square and self.selected_square != self.board_widgets[
-                        self.game_logic.forced_capture_piece]:
-                        self.selected_square.deselect()
-                    self.selected_square = self.board_widgets[self.game_logic.forced_capture_piece]
-                    self.selected_square.select()
+                    self.select_square(game_logic.forced_capture_piece)
 
                     # Update highlights for the remaining captures
-                    r, c = self.game_logic.forced_capture_piece
-                    remaining_moves, _ = self.game_logic.get_possible_moves(r, c,
-                                                                            board=self.game_logic.get_board_state(),
-                                                                            player_type=self.game_logic.get_current_player())
+                    r, c = game_logic.forced_capture_piece
+                    remaining_moves, _ = game_logic.get_possible_moves(r, c,
+                                                                       board=game_logic.board,
+                                                                       player_type=game_logic.get_current_player())
                     self.possible_moves_for_selected = remaining_moves
                     self.clear_highlights()
                     self.highlight_possible_moves(self.possible_moves_for_selected)
 
                 else:
                     # No more forced captures, or it was a normal move, so clear selection.
-                    if self.selected_square:  # Ensure selected_square is not None before calling deselect
-                        self.selected_square.deselect()
-                    self.selected_square = None
-                    self.game_logic.selected_piece_pos = None
+                    self.select_square(None)
+                    game_logic.selected_piece_pos = None
                     self.clear_highlights()  # Remove highlights
 
                     # If game not over, and it's AI's turn
-                    if self.game_logic.get_current_player() == self.game_logic.get_ai_color():
-                        self.ai_timer.start(1000)  # Start AI after 1 second delay
+                    if game_logic.get_current_player() == game_logic.get_ai_color():
+                        self._schedule_ai_turn(0)  # Start AI once the move is shown; it searches in the background
             else:
-                self.game_logic.message = "Niepoprawny ruch: " + self.game_logic.get_message()
+                game_logic.message = "Niepoprawny ruch: " + game_logic.get_message()
                 self.update_status()
 
+    def _schedule_ai_turn(self, delay_ms):
+        """Starts the AI's turn after delay_ms, unless it is already scheduled."""
+        if not self.ai_timer.isActive():
+            self.ai_timer.start(delay_ms)
+
     def make_ai_move(self):
         """Executes the AI's move."""
-        # print("make_ai_move called.")
         if self.game_logic.get_current_player() == self.game_logic.get_ai_color():  # Ensure it's AI's turn
             self.game_logic.message = "AI myśli..."
             self.update_status()
-            QApplication.processEvents()  # Process events to update UI immediately
-
-            ai_start_pos, ai_end_pos = self.game_logic.get_ai_move()
-            # print(f"AI returned: start={ai_start_pos}, end={ai_end_pos}")
-
-            if ai_start_pos is not None and ai_end_pos is not None:
-                # Simulate selection and move on GUI for better feedback
-                # Ensure the previously selected square (if any) is deselected
-                if self.selected_square:
-                    self.selected_square.deselect()
-                self.selected_square = self.board_widgets[ai_start_pos]
-                self.selected_square.select()
-                self.game_logic.selected_piece_pos = ai_start_pos
-                QApplication.processEvents()  # Process events to show selection
-
-                # Small delay before executing AI move
-                QTimer.singleShot(500, lambda: self._execute_ai_move_on_gui(ai_start_pos, ai_end_pos))
-            else:
-                # print("AI could not find a move.")
-                # This block is for when AI explicitly cannot find a move.
-                game_over = self.game_logic.check_game_over()  # Check for game over (if AI couldn't move, it might be game over for it)
-                self.update_status()  # Update status with any new game over message
-                if game_over:
-                    QMessageBox.information(self, "Koniec Gry", self.game_logic.get_message())
-                else:  # This path means AI had moves according to logic, but get_ai_move returned None unexpectedly
-                    self.game_logic.message = "AI napotkało problem w znalezieniu ruchu. Spróbuj ponownie."
-                    self.update_status()
+
+            # The search runs on the AI thread and reports back through _ai_move_found.
+            # A search still running here belongs to an abandoned game; it was asked to stop, and this
+            # search starts from _ai_thread_finished once it has, without blocking the window meanwhile.
+            if self.ai_thread.isRunning():
+                self._ai_search_waiting = True
+                return
+            self.ai_thread.search_id = self.ai_search_id
+            self.ai_thread.start()
+
+    def _ai_thread_finished(self):
+        """Starts the AI turn that was waiting for the previous search to end, if any."""
+        if self._ai_search_waiting:
+            self._ai_search_waiting = False
+            self.make_ai_move()
+
+    def _ai_move_found(self, search_id, ai_start_pos, ai_end_pos):
+        """Shows and executes the move found by the AI thread."""
+        if search_id != self.ai_search_id:
+            return  # Search from before a new game was started
+
+        if ai_start_pos is not None and ai_end_pos is not None:
+            # Simulate selection and move on GUI for better feedback
+            # (selecting the square also deselects the previously selected one, if any)
+            self.select_square(ai_start_pos)
+            self.game_logic.selected_piece_pos = ai_start_pos
+
+            # Small delay before executing AI move
+            self._pending_ai_move = (ai_start_pos, ai_end_pos)
+            self.ai_move_timer.start()
+        else:
+            # This block is for when AI explicitly cannot find a move.
+            game_over = self.game_logic.check_game_over()  # Check for game over (if AI couldn't move, it might be game over for it)
+            self.update_status()  # Update status with any new game over message
+            if game_over:
+                QMessageBox.information(self, "Koniec Gry", self.game_logic.get_message())
+            else:  # This path means AI had moves according to logic, but get_ai_move returned None unexpectedly
+                self.game_logic.message = "AI napotkało problem w znalezieniu ruchu. Spróbuj ponownie."
+                self.update_status()
+
+    def _run_pending_ai_move(self):
+        """Makes the AI move shown by _ai_move_found, unless a new game has discarded it."""
+        if self._pending_ai_move is None:
+            return
+        start_pos, end_pos = self._pending_ai_move
+        self._pending_ai_move = None
+        self._execute_ai_move_on_gui(start_pos, end_pos)
 
     def _execute_ai_move_on_gui(self, start_pos, end_pos):
         """Helper to execute AI move on GUI after a short delay."""
@@ -438,25 +647,19 @@ class CheckersGameGUI(QWidget):
             # that needs to continue capturing for consistency in game_logic.
             self.game_logic.selected_piece_pos = self.game_logic.forced_capture_piece
             # Ensure the selected_square in GUI reflects the new forced_capture_piece
-            if self.selected_square:
-                self.selected_square.deselect()  # Deselect old square if it was selected
-            self.selected_square = self.board_widgets[self.game_logic.forced_capture_piece]
-            self.selected_square.select()  # Select the piece that must continue capturing
+            self.select_square(self.game_logic.forced_capture_piece)
 
             self.clear_highlights()  # Clear previous highlights
             r, c = self.game_logic.forced_capture_piece
             remaining_moves, _ = self.game_logic.get_possible_moves(r, c,
-                                                                    board=self.game_logic.get_board_state(),
+                                                                    board=self.game_logic.board,
                                                                     player_type=self.game_logic.get_current_player())
             self.highlight_possible_moves(remaining_moves)  # Highlight new possible captures
 
-            self.ai_timer.start(500)  # Shorter delay for subsequent captures
-            # print("AI: Continuing forced capture.")
+            self._schedule_ai_turn(500)  # Shorter delay for subsequent captures
         else:
             # No more forced captures for AI, clear selection and highlights
-            if self.selected_square:  # Ensure selected_square is not None before calling deselect
-                self.selected_square.deselect()
-            self.selected_square = None
+            self.select_square(None)
             self.game_logic.selected_piece_pos = None
             self.clear_highlights()
 
@@ -468,65 +671,49 @@ class CheckersGameGUI(QWidget):
                 QMessageBox.information(self, "Koniec Gry", self.game_logic.get_message())
             # If game not over and AI's turn is done, human's turn starts, no timer.
 
-    def show_new_game_dialog(self):
-        """Shows a dialog to choose AI difficulty and player color."""
+    def closeEvent(self, event):
+        """Stops the AI's search when the window is closed."""
+        self.ai_timer.stop()
+        self.ai_move_timer.stop()
+        self.ai_search_id += 1
+        self._ai_search_waiting = False
+        # The thread must not outlive the window. Asked to stop, the search ends after the root move
+        # it is searching, so the wait is short.
+        self.ai_thread.requestInterruption()
+        self.ai_thread.wait()
+        super().closeEvent(event)
+
+    def _build_new_game_dialog(self):
+        """Builds the dialog to choose AI difficulty and player color."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Nowa Gra - Ustawienia")
         dialog.setFixedSize(300, 250)  # Fixed size for the dialog
         dialog_layout = QVBoxLayout()
         dialog_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        dialog.setStyleSheet("background-color: darkgray; border-radius: 10px;")  # Slightly brighter background
+        # One style sheet for the whole dialog, parsed once instead of one per widget
+        dialog.setStyleSheet(self.NEW_GAME_DIALOG_STYLE)
 
         # Difficulty selection
         difficulty_label = QLabel("Wybierz trudność AI:")
-        difficulty_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
         dialog_layout.addWidget(difficulty_label)
 
         difficulty_combo = QComboBox()
         difficulty_combo.addItems(list(CheckersGameLogic.AI_SEARCH_DEPTH_MAP.keys()))
-        # Set default selection based on current game difficulty
-        current_difficulty_index = list(CheckersGameLogic.AI_SEARCH_DEPTH_MAP.keys()).index(
-            self.game_logic.ai_difficulty)
-        difficulty_combo.setCurrentIndex(current_difficulty_index)
-        difficulty_combo.setStyleSheet("""
-            QComboBox {
-                border: 1px solid gray;
-                border-radius: 5px;
-                padding: 5px;
-                background: gray;
-                selection-background-color: #A3D900;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 1px;
-                border-left-color: darkgray;
-                border-left-style: solid;
-                border-top-right-radius: 3px;
-                border-bottom-right-radius: 3px;
-            }
-        """)
         dialog_layout.addWidget(difficulty_combo)
         dialog_layout.addSpacing(20)
 
         # Player color selection
         color_label = QLabel("Wybierz kolor gracza:")
-        color_label.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
         dialog_layout.addWidget(color_label)
 
         color_radio_layout = QHBoxLayout()
         color_radio_group = QButtonGroup(dialog)
 
         white_radio = QRadioButton("Białe (pierwszy ruch)")
-        white_radio.setStyleSheet("color: black;")  # Changed to black for better readability
-        white_radio.setChecked(self.game_logic.get_player_color() == 1)
         color_radio_group.addButton(white_radio, 1)  # Value 1 for white
         color_radio_layout.addWidget(white_radio)
 
         black_radio = QRadioButton("Czarne")
-        black_radio.setStyleSheet("color: black;")  # Changed to black for better readability
-        black_radio.setChecked(self.game_logic.get_player_color() == 2)
         color_radio_group.addButton(black_radio, 2)  # Value 2 for black
         color_radio_layout.addWidget(black_radio)
 
@@ -536,18 +723,6 @@ class CheckersGameGUI(QWidget):
         # Buttons
         button_box = QHBoxLayout()
         ok_button = QPushButton("Rozpocznij Grę")
-        ok_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3; /* Blue */
-                color: white;
-                border-radius: 8px;
-                padding: 8px 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0B7CD8;
-            }
-        """)
         ok_button.clicked.connect(dialog.accept)
         button_box.addStretch()
         button_box.addWidget(ok_button)
@@ -556,23 +731,48 @@ class CheckersGameGUI(QWidget):
         dialog_layout.addLayout(button_box)
         dialog.setLayout(dialog_layout)
 
+        self._new_game_difficulty_combo = difficulty_combo
+        self._new_game_color_group = color_radio_group
+        return dialog
+
+    def show_new_game_dialog(self):
+        """Shows a dialog to choose AI difficulty and player color."""
+        if self._new_game_dialog is None:
+            self._new_game_dialog = self._build_new_game_dialog()
+        dialog = self._new_game_dialog
+
+        # Set default selection based on current game settings
+        current_difficulty_index = list(CheckersGameLogic.AI_SEARCH_DEPTH_MAP.keys()).index(
+            self.game_logic.ai_difficulty)
+        self._new_game_difficulty_combo.setCurrentIndex(current_difficulty_index)
+        self._new_game_color_group.button(self.game_logic.get_player_color()).setChecked(True)
+
         # Execute dialog and handle result
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            selected_difficulty = difficulty_combo.currentText()
-            selected_color = color_radio_group.checkedId()
+            selected_difficulty = self._new_game_difficulty_combo.currentText()
+            selected_color = self._new_game_color_group.checkedId()
             self.start_new_game(selected_difficulty, selected_color)
 
     def start_new_game(self, ai_difficulty, player_color):
         """Starts a new game with the chosen settings."""
         self.ai_timer.stop()  # Stop any pending AI moves
+        self.ai_move_timer.stop()
+        self.ai_search_id += 1  # and ignore the result of a search still running,
+        self.ai_thread.requestInterruption()  # which is asked to stop
+        self._ai_search_waiting = False
+        self._pending_ai_move = None
         self.game_logic.reset_game(ai_difficulty, player_color)  # Reset game logic with new settings
 
-        self.update_board_display()
-        if self.selected_square:
-            self.selected_square.deselect()
-            self.selected_square = None
-        self.possible_moves_for_selected = []
-        self.clear_highlights()
+        # Most squares change on a new game: instead of collecting a repaint for each of them,
+        # updates are suspended and the board is repainted once as a whole when they resume.
+        self.board_widget.setUpdatesEnabled(False)
+        try:
+            self.update_board_display()
+            self.select_square(None)
+            self.possible_moves_for_selected = []
+            self.clear_highlights()
+        finally:
+            self.board_widget.setUpdatesEnabled(True)
         self.update_status()
 
         QMessageBox.information(self, "Nowa Gra", "Rozpoczęto nową grę z wybranymi ustawieniami!")
@@ -580,7 +780,7 @@ class CheckersGameGUI(QWidget):
         # If AI is black (player 2) and is the current player, AI should make the first move
         # (This handles the case where human chooses Black, so AI is White and moves first)
         if self.game_logic.get_current_player() == self.game_logic.get_ai_color():
-            self.ai_timer.start(1000)  # Give a short delay before AI moves
+            self._schedule_ai_turn(0)  # AI moves once the board is shown
 
 
 if __name__ == '__main__':